@@ -7,8 +7,12 @@ Generates comprehensive reports comparing performance, quality, and scalability.
 import os
 import sys
 import json
+import hashlib
+from operator import itemgetter
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Reports are written to files; never open a GUI window
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
@@ -17,8 +21,14 @@ from dataclasses import dataclass
 import statistics
 import scipy.stats as stats
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -26,7 +36,7 @@ logger = logging.getLogger(__name__)
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BenchmarkSummary:
     """Summary statistics for a transpiler."""
     transpiler: str
@@ -40,6 +50,99 @@ class BenchmarkSummary:
     success_rate: float
     quality_score: float
 
+# Flattened result columns, in row order, with the dtype each column is stored as;
+# repeated string keys are categorical so grouping hashes integer codes
+RESULT_SCHEMA = {
+    'transpiler': 'category',
+    'dataset': 'category',
+    'timestamp': np.float64,
+    'success': np.bool_,
+    'transpiler_version': 'category',
+    
+    # Performance metrics
+    'compilation_time_ms': np.float64,
+    'memory_peak_mb': np.float64,
+    'memory_avg_mb': np.float64,
+    'cpu_percent': np.float64,
+    'output_size_bytes': np.int64,
+    'source_map_size_bytes': np.int64,
+    'error_count': np.int64,
+    'warning_count': np.int64,
+    'lines_per_second': np.float64,
+    
+    # Quality metrics
+    'output_correctness': np.float64,
+    'runtime_performance': np.float64,
+    'source_map_accuracy': np.float64,
+    'error_message_quality': np.float64,
+    'bundle_efficiency': np.float64,
+    
+    # Dataset info
+    'dataset_lines': np.int64,
+    'dataset_files': np.int64,
+    'dataset_size_bytes': np.int64,
+}
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for values neither JSON backend handles natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj as indented JSON bytes, using orjson when it is installed.
+    
+    orjson encodes numpy scalars and datetimes natively, so the default hook
+    only runs for genuinely unknown types.
+    """
+    if orjson:
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, default=_json_default).encode()
+
+# Version of the cached results frame layout
+RESULTS_CACHE_VERSION = 3
+
+# Quality metrics averaged into the per-result quality score
+QUALITY_METRICS = ['output_correctness', 'runtime_performance', 'source_map_accuracy',
+                   'error_message_quality', 'bundle_efficiency']
+
+# Scatter plots draw at most this many points per transpiler
+MAX_SCATTER_POINTS = 500
+
+# Getters pulling each nested section's fields in RESULT_SCHEMA order
+_performance_fields = itemgetter(
+    'compilation_time_ms', 'memory_peak_mb', 'memory_avg_mb', 'cpu_percent',
+    'output_size_bytes', 'source_map_size_bytes', 'error_count', 'warning_count',
+    'lines_per_second',
+)
+_quality_fields = itemgetter(*QUALITY_METRICS)
+
+def flatten_result(data: Dict[str, Any]) -> Tuple:
+    """Flatten a nested benchmark result into a row ordered like RESULT_SCHEMA."""
+    meta = data['metadata']
+    stats_ds = meta['dataset_stats']
+    return (
+        data['transpiler'],
+        data['dataset'],
+        data['timestamp'],
+        meta['success'],
+        meta['transpiler_version'],
+        *_performance_fields(data['performance']),
+        *_quality_fields(data['quality']),
+        
+        # Dataset info
+        stats_ds.get('total_lines', 0),
+        stats_ds.get('total_files', 0),
+        stats_ds.get('total_size_bytes', 0),
+    )
+
 class ResultsAnalyzer:
     """Analyze and compare transpiler benchmark results."""
     
@@ -50,263 +153,266 @@ class ResultsAnalyzer:
         
     def load_results(self) -> pd.DataFrame:
         """Load all benchmark results into a DataFrame."""
-        results = []
+        result_files = list(self.results_dir.glob('*.json'))
         
-        for result_file in self.results_dir.glob('*.json'):
+        # Reuse the frame from the previous run if no result file changed
+        cache_file = self._results_cache_path(result_files)
+        if cache_file.exists():
             try:
-                with open(result_file, 'r') as f:
-                    data = json.load(f)
-                    
-                # Flatten the nested structure
-                flattened = {
-                    'transpiler': data['transpiler'],
-                    'dataset': data['dataset'],
-                    'timestamp': data['timestamp'],
-                    'success': data['metadata']['success'],
-                    'transpiler_version': data['metadata']['transpiler_version'],
-                    
-                    # Performance metrics
-                    'compilation_time_ms': data['performance']['compilation_time_ms'],
-                    'memory_peak_mb': data['performance']['memory_peak_mb'],
-                    'memory_avg_mb': data['performance']['memory_avg_mb'],
-                    'cpu_percent': data['performance']['cpu_percent'],
-                    'output_size_bytes': data['performance']['output_size_bytes'],
-                    'source_map_size_bytes': data['performance']['source_map_size_bytes'],
-                    'error_count': data['performance']['error_count'],
-                    'warning_count': data['performance']['warning_count'],
-                    'lines_per_second': data['performance']['lines_per_second'],
-                    
-                    # Quality metrics
-                    'output_correctness': data['quality']['output_correctness'],
-                    'runtime_performance': data['quality']['runtime_performance'],
-                    'source_map_accuracy': data['quality']['source_map_accuracy'],
-                    'error_message_quality': data['quality']['error_message_quality'],
-                    'bundle_efficiency': data['quality']['bundle_efficiency'],
-                    
-                    # Dataset info
-                    'dataset_lines': data['metadata']['dataset_stats'].get('total_lines', 0),
-                    'dataset_files': data['metadata']['dataset_stats'].get('total_files', 0),
-                    'dataset_size_bytes': data['metadata']['dataset_stats'].get('total_size_bytes', 0),
-                }
-                
-                results.append(flattened)
-                
+                return pd.read_pickle(cache_file)
             except Exception as e:
-                logger.warning(f"Failed to load {result_file}: {e}")
-                continue
+                logger.warning(f"Failed to load results cache {cache_file}: {e}")
+        
+        # Reading is I/O-bound, so overlap the per-file reads on a thread pool
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = [r for r in executor.map(self._load_result_file, result_files) if r is not None]
         
         if not results:
             logger.error("No valid results found")
             return pd.DataFrame()
         
-        df = pd.DataFrame(results)
-        df['datetime'] = pd.to_datetime(df['timestamp'], unit='s')
+        # Transpose rows into typed columns so pandas never infers dtypes per row
+        df = pd.DataFrame({
+            name: pd.Categorical(column) if dtype == 'category' else np.asarray(column, dtype=dtype)
+            for (name, dtype), column in zip(RESULT_SCHEMA.items(), zip(*results))
+        })
         df['output_size_kb'] = df['output_size_bytes'] / 1024
-        df['dataset_size_kb'] = df['dataset_size_bytes'] / 1024
+        df['quality_score'] = df[QUALITY_METRICS].to_numpy(dtype=np.float64).mean(axis=1)
+        
+        self._write_results_cache(cache_file, df)
         
         return df
     
+    def _results_cache_path(self, result_files: List[Path]) -> Path:
+        """Cache location for the loaded frame, keyed on result file names and mtimes."""
+        # Bump RESULTS_CACHE_VERSION whenever the columns built by load_results() change
+        digest = hashlib.blake2b(RESULTS_CACHE_VERSION.to_bytes(4, 'little'))
+        for result_file in sorted(result_files):
+            st = result_file.stat()
+            digest.update(f"{result_file.name}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+        return self.reports_dir / f"results_cache_{digest.hexdigest()[:16]}.pkl"
+    
+    def _write_results_cache(self, cache_file: Path, df: pd.DataFrame):
+        """Persist the loaded frame, dropping caches for older result sets."""
+        try:
+            for stale in self.reports_dir.glob('results_cache_*.pkl'):
+                stale.unlink()
+            df.to_pickle(cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to write results cache {cache_file}: {e}")
+    
+    def _load_result_file(self, result_file: Path) -> Optional[Tuple]:
+        """Parse and flatten a single result file, or None if it is invalid."""
+        try:
+            return flatten_result(json_loads(result_file.read_bytes()))
+        except Exception as e:
+            logger.warning(f"Failed to load {result_file}: {e}")
+            return None
+    
     def generate_summary_stats(self, df: pd.DataFrame) -> List[BenchmarkSummary]:
         """Generate summary statistics for each transpiler."""
-        summaries = []
-        
-        for transpiler in df['transpiler'].unique():
-            trans_data = df[df['transpiler'] == transpiler]
-            
-            # Calculate quality score (weighted average of quality metrics)
-            quality_cols = ['output_correctness', 'runtime_performance', 'source_map_accuracy', 
-                          'error_message_quality', 'bundle_efficiency']
-            quality_score = trans_data[quality_cols].mean().mean()
-            
-            summary = BenchmarkSummary(
-                transpiler=transpiler,
-                datasets_tested=len(trans_data['dataset'].unique()),
-                avg_compilation_time_ms=trans_data['compilation_time_ms'].mean(),
-                std_compilation_time_ms=trans_data['compilation_time_ms'].std(),
-                avg_memory_peak_mb=trans_data['memory_peak_mb'].mean(),
-                std_memory_peak_mb=trans_data['memory_peak_mb'].std(),
-                avg_output_size_kb=trans_data['output_size_kb'].mean(),
-                avg_lines_per_second=trans_data['lines_per_second'].mean(),
-                success_rate=trans_data['success'].mean(),
-                quality_score=quality_score
-            )
-            
-            summaries.append(summary)
-        
-        return summaries
+        grouped = df.groupby('transpiler', sort=False, observed=True)
+        
+        # One grouped pass computes every per-transpiler aggregate
+        agg = grouped.agg(
+            datasets_tested=('dataset', 'nunique'),
+            avg_compilation_time_ms=('compilation_time_ms', 'mean'),
+            std_compilation_time_ms=('compilation_time_ms', 'std'),
+            avg_memory_peak_mb=('memory_peak_mb', 'mean'),
+            std_memory_peak_mb=('memory_peak_mb', 'std'),
+            avg_output_size_kb=('output_size_kb', 'mean'),
+            avg_lines_per_second=('lines_per_second', 'mean'),
+            success_rate=('success', 'mean'),
+        )
+        
+        # Calculate quality score (weighted average of quality metrics)
+        agg['quality_score'] = grouped[QUALITY_METRICS].mean().mean(axis=1)
+        
+        return [
+            BenchmarkSummary(transpiler=transpiler, **row)
+            for transpiler, row in zip(agg.index, agg.to_dict('records'))
+        ]
     
-    def create_performance_plots(self, df: pd.DataFrame):
+    def transpiler_indices(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Row positions of each transpiler's results, in first-seen order."""
+        return df.groupby('transpiler', sort=False, observed=True).indices
+    
+    def create_performance_plots(self, df: pd.DataFrame,
+                                 trans_idx: Optional[Dict[str, np.ndarray]] = None):
         """Create performance comparison plots."""
         
-        # Compilation time comparison
-        plt.figure(figsize=(12, 8))
-        
-        plt.subplot(2, 2, 1)
-        sns.boxplot(data=df, x='transpiler', y='compilation_time_ms')
-        plt.title('Compilation Time Comparison')
-        plt.ylabel('Time (ms)')
-        plt.xticks(rotation=45)
-        
-        plt.subplot(2, 2, 2)
-        sns.boxplot(data=df, x='transpiler', y='memory_peak_mb')
-        plt.title('Peak Memory Usage Comparison')
-        plt.ylabel('Memory (MB)')
-        plt.xticks(rotation=45)
-        
-        plt.subplot(2, 2, 3)
-        sns.boxplot(data=df, x='transpiler', y='lines_per_second')
-        plt.title('Throughput Comparison')
-        plt.ylabel('Lines per Second')
-        plt.xticks(rotation=45)
-        
-        plt.subplot(2, 2, 4)
-        sns.boxplot(data=df, x='transpiler', y='output_size_kb')
-        plt.title('Output Size Comparison')
-        plt.ylabel('Size (KB)')
-        plt.xticks(rotation=45)
-        
-        plt.tight_layout()
-        plt.savefig(self.reports_dir / 'performance_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig, axes = plt.subplots(2, 2, figsize=(12, 8), layout='tight')
+        
+        if trans_idx is None:
+            trans_idx = self.transpiler_indices(df)
+        
+        panels = [
+            (axes[0, 0], 'compilation_time_ms', 'Compilation Time Comparison', 'Time (ms)'),
+            (axes[0, 1], 'memory_peak_mb', 'Peak Memory Usage Comparison', 'Memory (MB)'),
+            (axes[1, 0], 'lines_per_second', 'Throughput Comparison', 'Lines per Second'),
+            (axes[1, 1], 'output_size_kb', 'Output Size Comparison', 'Size (KB)'),
+        ]
+        for ax, column, title, ylabel in panels:
+            values = df[column].to_numpy(dtype=np.float64)
+            by_transpiler = [values[idx][~np.isnan(values[idx])] for idx in trans_idx.values()]
+            ax.boxplot(by_transpiler, patch_artist=True)
+            ax.set_xticks(range(1, len(trans_idx) + 1), list(trans_idx))
+            ax.set_title(title)
+            ax.set_xlabel('transpiler')
+            ax.set_ylabel(ylabel)
+            ax.tick_params(axis='x', labelrotation=45)
+        
+        fig.savefig(self.reports_dir / 'performance_comparison.png', dpi=150)
+        plt.close(fig)
         
         logger.info("Generated performance comparison plots")
     
-    def create_scalability_plots(self, df: pd.DataFrame):
+    def create_scalability_plots(self, df: pd.DataFrame,
+                                 trans_idx: Optional[Dict[str, np.ndarray]] = None):
         """Create scalability analysis plots."""
         
-        plt.figure(figsize=(15, 10))
+        fig, axes = plt.subplots(2, 3, figsize=(15, 10), layout='tight')
+        
+        if trans_idx is None:
+            trans_idx = self.transpiler_indices(df)
+        # Subsample large groups so rasterizing and encoding stay cheap
+        rng = np.random.default_rng(0)
+        trans_idx = {
+            t: np.sort(rng.choice(idx, MAX_SCATTER_POINTS, replace=False))
+            if len(idx) > MAX_SCATTER_POINTS else idx
+            for t, idx in trans_idx.items()
+        }
+        dataset_lines = df['dataset_lines'].to_numpy()
         
         # Time vs dataset size
-        plt.subplot(2, 3, 1)
-        for transpiler in df['transpiler'].unique():
-            trans_data = df[df['transpiler'] == transpiler]
-            plt.scatter(trans_data['dataset_lines'], trans_data['compilation_time_ms'], 
-                       label=transpiler, alpha=0.7)
-        plt.xlabel('Dataset Lines of Code')
-        plt.ylabel('Compilation Time (ms)')
-        plt.title('Compilation Time vs Dataset Size')
-        plt.legend()
-        plt.xscale('log')
-        plt.yscale('log')
+        ax = axes[0, 0]
+        y = df['compilation_time_ms'].to_numpy()
+        for transpiler, idx in trans_idx.items():
+            ax.scatter(dataset_lines[idx], y[idx], label=transpiler, alpha=0.7)
+        ax.set_xlabel('Dataset Lines of Code')
+        ax.set_ylabel('Compilation Time (ms)')
+        ax.set_title('Compilation Time vs Dataset Size')
+        ax.legend()
+        ax.set_xscale('log')
+        ax.set_yscale('log')
         
         # Memory vs dataset size
-        plt.subplot(2, 3, 2)
-        for transpiler in df['transpiler'].unique():
-            trans_data = df[df['transpiler'] == transpiler]
-            plt.scatter(trans_data['dataset_lines'], trans_data['memory_peak_mb'], 
-                       label=transpiler, alpha=0.7)
-        plt.xlabel('Dataset Lines of Code')
-        plt.ylabel('Peak Memory (MB)')
-        plt.title('Memory Usage vs Dataset Size')
-        plt.legend()
-        plt.xscale('log')
+        ax = axes[0, 1]
+        y = df['memory_peak_mb'].to_numpy()
+        for transpiler, idx in trans_idx.items():
+            ax.scatter(dataset_lines[idx], y[idx], label=transpiler, alpha=0.7)
+        ax.set_xlabel('Dataset Lines of Code')
+        ax.set_ylabel('Peak Memory (MB)')
+        ax.set_title('Memory Usage vs Dataset Size')
+        ax.legend()
+        ax.set_xscale('log')
         
         # Output size vs input size
-        plt.subplot(2, 3, 3)
-        for transpiler in df['transpiler'].unique():
-            trans_data = df[df['transpiler'] == transpiler]
-            plt.scatter(trans_data['dataset_size_kb'], trans_data['output_size_kb'], 
-                       label=transpiler, alpha=0.7)
-        plt.xlabel('Input Size (KB)')
-        plt.ylabel('Output Size (KB)')
-        plt.title('Output vs Input Size')
-        plt.legend()
+        ax = axes[0, 2]
+        x = df['dataset_size_bytes'].to_numpy() / 1024
+        y = df['output_size_kb'].to_numpy()
+        for transpiler, idx in trans_idx.items():
+            ax.scatter(x[idx], y[idx], label=transpiler, alpha=0.7)
+        ax.set_xlabel('Input Size (KB)')
+        ax.set_ylabel('Output Size (KB)')
+        ax.set_title('Output vs Input Size')
+        ax.legend()
         
         # Throughput vs dataset size
-        plt.subplot(2, 3, 4)
-        for transpiler in df['transpiler'].unique():
-            trans_data = df[df['transpiler'] == transpiler]
-            plt.scatter(trans_data['dataset_lines'], trans_data['lines_per_second'], 
-                       label=transpiler, alpha=0.7)
-        plt.xlabel('Dataset Lines of Code')
-        plt.ylabel('Lines per Second')
-        plt.title('Throughput vs Dataset Size')
-        plt.legend()
-        plt.xscale('log')
+        ax = axes[1, 0]
+        y = df['lines_per_second'].to_numpy()
+        for transpiler, idx in trans_idx.items():
+            ax.scatter(dataset_lines[idx], y[idx], label=transpiler, alpha=0.7)
+        ax.set_xlabel('Dataset Lines of Code')
+        ax.set_ylabel('Lines per Second')
+        ax.set_title('Throughput vs Dataset Size')
+        ax.legend()
+        ax.set_xscale('log')
         
         # Quality vs dataset size
-        plt.subplot(2, 3, 5)
-        quality_cols = ['output_correctness', 'runtime_performance', 'source_map_accuracy', 
-                       'error_message_quality', 'bundle_efficiency']
-        df['quality_score'] = df[quality_cols].mean(axis=1)
-        
-        for transpiler in df['transpiler'].unique():
-            trans_data = df[df['transpiler'] == transpiler]
-            plt.scatter(trans_data['dataset_lines'], trans_data['quality_score'], 
-                       label=transpiler, alpha=0.7)
-        plt.xlabel('Dataset Lines of Code')
-        plt.ylabel('Quality Score')
-        plt.title('Quality vs Dataset Size')
-        plt.legend()
-        plt.xscale('log')
+        ax = axes[1, 1]
+        y = df['quality_score'].to_numpy()
+        for transpiler, idx in trans_idx.items():
+            ax.scatter(dataset_lines[idx], y[idx], label=transpiler, alpha=0.7)
+        ax.set_xlabel('Dataset Lines of Code')
+        ax.set_ylabel('Quality Score')
+        ax.set_title('Quality vs Dataset Size')
+        ax.legend()
+        ax.set_xscale('log')
         
         # Success rate by transpiler
-        plt.subplot(2, 3, 6)
-        success_rates = df.groupby('transpiler')['success'].mean()
-        success_rates.plot(kind='bar')
-        plt.title('Success Rate by Transpiler')
-        plt.ylabel('Success Rate')
-        plt.xticks(rotation=45)
+        ax = axes[1, 2]
+        success_rates = df.groupby('transpiler', observed=True)['success'].mean()
+        success_rates.plot(kind='bar', ax=ax)
+        ax.set_title('Success Rate by Transpiler')
+        ax.set_ylabel('Success Rate')
+        ax.tick_params(axis='x', labelrotation=45)
         
-        plt.tight_layout()
-        plt.savefig(self.reports_dir / 'scalability_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(self.reports_dir / 'scalability_analysis.png', dpi=150)
+        plt.close(fig)
         
         logger.info("Generated scalability analysis plots")
     
     def create_quality_radar_chart(self, df: pd.DataFrame):
         """Create radar chart comparing quality metrics."""
         
-        quality_metrics = ['output_correctness', 'runtime_performance', 'source_map_accuracy', 
-                          'error_message_quality', 'bundle_efficiency']
-        
         # Calculate average quality scores per transpiler
-        quality_data = df.groupby('transpiler')[quality_metrics].mean()
+        quality_data = df.groupby('transpiler', observed=True)[QUALITY_METRICS].mean()
         
-        # Set up radar chart
-        angles = np.linspace(0, 2 * np.pi, len(quality_metrics), endpoint=False).tolist()
-        angles += angles[:1]  # Complete the circle
+        # Set up radar chart; repeat the first column to complete each circle
+        angles = np.linspace(0, 2 * np.pi, len(QUALITY_METRICS), endpoint=False)
+        angles = np.concatenate([angles, angles[:1]])
+        values = quality_data.to_numpy()
+        values = np.hstack([values, values[:, :1]])  # (transpilers, metrics + 1)
         
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'), layout='tight')
         
         colors = plt.cm.Set1(np.linspace(0, 1, len(quality_data)))
         
-        for i, (transpiler, scores) in enumerate(quality_data.iterrows()):
-            values = scores.tolist()
-            values += values[:1]  # Complete the circle
-            
-            ax.plot(angles, values, 'o-', linewidth=2, label=transpiler, color=colors[i])
-            ax.fill(angles, values, alpha=0.25, color=colors[i])
+        # One plot call draws every transpiler's outline; fill does not broadcast
+        lines = ax.plot(angles, values.T, 'o-', linewidth=2)
+        for line, transpiler, row, color in zip(lines, quality_data.index, values, colors):
+            line.set_color(color)
+            line.set_label(transpiler)
+            ax.fill(angles, row, alpha=0.25, color=color)
         
         # Customize the chart
         ax.set_xticks(angles[:-1])
-        ax.set_xticklabels([metric.replace('_', ' ').title() for metric in quality_metrics])
+        ax.set_xticklabels([metric.replace('_', ' ').title() for metric in QUALITY_METRICS])
         ax.set_ylim(0, 1)
         ax.set_yticks([0.2, 0.4, 0.6, 0.8, 1.0])
         ax.set_yticklabels(['0.2', '0.4', '0.6', '0.8', '1.0'])
         ax.grid(True)
         
-        plt.legend(loc='upper right', bbox_to_anchor=(1.2, 1))
-        plt.title('Quality Metrics Comparison', size=16, fontweight='bold', pad=20)
+        ax.legend(loc='upper right', bbox_to_anchor=(1.2, 1))
+        ax.set_title('Quality Metrics Comparison', size=16, fontweight='bold', pad=20)
         
-        plt.savefig(self.reports_dir / 'quality_radar_chart.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(self.reports_dir / 'quality_radar_chart.png', dpi=150)
+        plt.close(fig)
         
         logger.info("Generated quality radar chart")
     
-    def perform_statistical_tests(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def perform_statistical_tests(self, df: pd.DataFrame,
+                                  trans_idx: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, Any]:
         """Perform statistical significance tests."""
         results = {}
         
-        transpilers = df['transpiler'].unique()
+        if trans_idx is None:
+            trans_idx = self.transpiler_indices(df)
+        
+        # Extract each transpiler's compilation times once for all tests;
+        # NaNs are skipped by scipy via nan_policy='omit'
+        times = df['compilation_time_ms'].to_numpy()
+        groups = {transpiler: times[idx] for transpiler, idx in trans_idx.items()}
+        sizes = {transpiler: np.count_nonzero(~np.isnan(g)) for transpiler, g in groups.items()}
+        transpilers = list(groups)
         if len(transpilers) < 2:
             return results
         
         # Compilation time comparison
-        groups = [df[df['transpiler'] == t]['compilation_time_ms'].dropna() for t in transpilers]
-        if all(len(g) > 1 for g in groups):
+        if all(n > 1 for n in sizes.values()):
             try:
-                statistic, p_value = stats.kruskal(*groups)
+                statistic, p_value = stats.kruskal(*groups.values(), nan_policy='omit')
                 results['compilation_time_kruskal'] = {
                     'statistic': statistic,
                     'p_value': p_value,
@@ -319,17 +425,18 @@ class ResultsAnalyzer:
         results['pairwise_comparisons'] = {}
         for i, t1 in enumerate(transpilers):
             for t2 in transpilers[i+1:]:
-                group1 = df[df['transpiler'] == t1]['compilation_time_ms'].dropna()
-                group2 = df[df['transpiler'] == t2]['compilation_time_ms'].dropna()
+                group1 = groups[t1]
+                group2 = groups[t2]
                 
-                if len(group1) > 1 and len(group2) > 1:
+                if sizes[t1] > 1 and sizes[t2] > 1:
                     try:
-                        statistic, p_value = stats.mannwhitneyu(group1, group2, alternative='two-sided')
+                        statistic, p_value = stats.mannwhitneyu(group1, group2, alternative='two-sided',
+                                                                nan_policy='omit')
                         results['pairwise_comparisons'][f'{t1}_vs_{t2}'] = {
                             'statistic': statistic,
                             'p_value': p_value,
                             'significant': p_value < 0.05,
-                            'median_diff': group1.median() - group2.median()
+                            'median_diff': np.nanmedian(group1) - np.nanmedian(group2)
                         }
                     except Exception as e:
                         logger.warning(f"Failed pairwise test {t1} vs {t2}: {e}")
@@ -340,7 +447,7 @@ class ResultsAnalyzer:
                            stats_results: Dict[str, Any]):
         """Generate comprehensive HTML report."""
         
-        html_content = f"""
+        parts = [f"""
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -384,11 +491,11 @@ class ResultsAnalyzer:
                 
                 <h2>📊 Executive Summary</h2>
                 <div class="summary-grid">
-        """
+        """]
         
         # Add summary cards for each transpiler
         for summary in summaries:
-            html_content += f"""
+            parts.append(f"""
                     <div class="summary-card">
                         <h3>{summary.transpiler.upper()}</h3>
                         <div class="metric">
@@ -412,10 +519,10 @@ class ResultsAnalyzer:
                             <span class="metric-value">{summary.quality_score:.2f}/1.0</span>
                         </div>
                     </div>
-            """
+            """)
         
         # Detailed comparison table
-        html_content += f"""
+        parts.append(f"""
                 </div>
                 
                 <h2>📈 Detailed Performance Comparison</h2>
@@ -432,7 +539,7 @@ class ResultsAnalyzer:
                         </tr>
                     </thead>
                     <tbody>
-        """
+        """)
         
         # Find best performers for highlighting
         best_time = min(s.avg_compilation_time_ms for s in summaries)
@@ -441,7 +548,7 @@ class ResultsAnalyzer:
         best_quality = max(s.quality_score for s in summaries)
         
         for summary in sorted(summaries, key=lambda x: x.avg_compilation_time_ms):
-            html_content += f"""
+            parts.append(f"""
                         <tr>
                             <td><strong>{summary.transpiler}</strong></td>
                             <td class="{'best-score' if summary.avg_compilation_time_ms == best_time else ''}">{summary.avg_compilation_time_ms:.1f}</td>
@@ -451,9 +558,9 @@ class ResultsAnalyzer:
                             <td>{summary.success_rate:.1%}</td>
                             <td class="{'best-score' if summary.quality_score == best_quality else ''}">{summary.quality_score:.3f}</td>
                         </tr>
-            """
+            """)
         
-        html_content += """
+        parts.append("""
                     </tbody>
                 </table>
                 
@@ -472,19 +579,19 @@ class ResultsAnalyzer:
                     <h3>Quality Metrics Radar Chart</h3>
                     <img src="quality_radar_chart.png" alt="Quality Radar Chart">
                 </div>
-        """
+        """)
         
         # Statistical analysis section
         if stats_results:
-            html_content += """
+            parts.append("""
                 <h2>🧪 Statistical Analysis</h2>
                 <div class="stats-section">
-            """
+            """)
             
             if 'compilation_time_kruskal' in stats_results:
                 kruskal = stats_results['compilation_time_kruskal']
                 significance = 'significant' if kruskal['significant'] else 'not-significant'
-                html_content += f"""
+                parts.append(f"""
                     <h3>Overall Comparison (Kruskal-Wallis Test)</h3>
                     <p>Testing whether compilation times differ significantly across transpilers:</p>
                     <ul>
@@ -492,10 +599,10 @@ class ResultsAnalyzer:
                         <li>P-value: {kruskal['p_value']:.6f}</li>
                         <li>Result: <span class="{significance}">{'Significant' if kruskal['significant'] else 'Not Significant'}</span> difference found</li>
                     </ul>
-                """
+                """)
             
             if 'pairwise_comparisons' in stats_results:
-                html_content += """
+                parts.append("""
                     <h3>Pairwise Comparisons (Mann-Whitney U Tests)</h3>
                     <table>
                         <thead>
@@ -507,32 +614,32 @@ class ResultsAnalyzer:
                             </tr>
                         </thead>
                         <tbody>
-                """
+                """)
                 
                 for comparison, result in stats_results['pairwise_comparisons'].items():
                     significance = 'significant' if result['significant'] else 'not-significant'
-                    html_content += f"""
+                    parts.append(f"""
                             <tr>
                                 <td>{comparison.replace('_', ' vs ')}</td>
                                 <td>{result['p_value']:.6f}</td>
                                 <td><span class="{significance}">{'Significant' if result['significant'] else 'Not Significant'}</span></td>
                                 <td>{result['median_diff']:.1f}</td>
                             </tr>
-                    """
+                    """)
                 
-                html_content += """
+                parts.append("""
                         </tbody>
                     </table>
-                """
+                """)
             
-            html_content += "</div>"
+            parts.append("</div>")
         
         # Conclusions and recommendations
         fastest_transpiler = min(summaries, key=lambda x: x.avg_compilation_time_ms).transpiler
         most_efficient_memory = min(summaries, key=lambda x: x.avg_memory_peak_mb).transpiler
         highest_quality = max(summaries, key=lambda x: x.quality_score).transpiler
         
-        html_content += f"""
+        parts.append(f"""
                 <h2>🎯 Key Findings & Recommendations</h2>
                 <div class="stats-section">
                     <h3>Performance Leaders</h3>
@@ -550,12 +657,12 @@ class ResultsAnalyzer:
                     </ul>
                     
                     <h3>Ellex Performance Analysis</h3>
-        """
+        """)
         
         # Add specific analysis for Ellex
         ellex_summary = next((s for s in summaries if s.transpiler == 'ellex'), None)
         if ellex_summary:
-            html_content += f"""
+            parts.append(f"""
                     <p><strong>Ellex Transpiler Results:</strong></p>
                     <ul>
                         <li>Compilation Time: {ellex_summary.avg_compilation_time_ms:.1f} ms (avg)</li>
@@ -566,25 +673,33 @@ class ResultsAnalyzer:
                     
                     <p><strong>Competitive Analysis:</strong></p>
                     <ul>
-            """
+            """)
             
-            # Compare Ellex to others
-            for other in summaries:
-                if other.transpiler != 'ellex':
-                    time_ratio = ellex_summary.avg_compilation_time_ms / other.avg_compilation_time_ms
-                    memory_ratio = ellex_summary.avg_memory_peak_mb / other.avg_memory_peak_mb
-                    
-                    html_content += f"""
-                        <li><strong>vs {other.transpiler}:</strong> 
+            # Compare Ellex to others, computing every ratio in one vector op
+            others = np.array(
+                [(s.transpiler, s.avg_compilation_time_ms, s.avg_memory_peak_mb)
+                 for s in summaries if s.transpiler != 'ellex'],
+                dtype=[('transpiler', object), ('time', 'f8'), ('memory', 'f8')]
+            )
+            with np.errstate(divide='ignore', invalid='ignore'):
+                time_ratios = ellex_summary.avg_compilation_time_ms / others['time']
+                memory_ratios = ellex_summary.avg_memory_peak_mb / others['memory']
+            
+            parts.extend(
+                f"""
+                        <li><strong>vs {transpiler}:</strong> 
                             {time_ratio:.1f}x compilation time, 
                             {memory_ratio:.1f}x memory usage</li>
                     """
+                for transpiler, time_ratio, memory_ratio
+                in zip(others['transpiler'], time_ratios, memory_ratios)
+            )
             
-            html_content += "</ul>"
+            parts.append("</ul>")
         else:
-            html_content += "<p><em>Ellex results not available in this benchmark run.</em></p>"
+            parts.append("<p><em>Ellex results not available in this benchmark run.</em></p>")
         
-        html_content += """
+        parts.append("""
                 </div>
                 
                 <hr style="margin: 40px 0;">
@@ -595,11 +710,11 @@ class ResultsAnalyzer:
             </div>
         </body>
         </html>
-        """
+        """)
         
         # Save HTML report
         with open(self.reports_dir / 'benchmark_report.html', 'w') as f:
-            f.write(html_content)
+            f.write(''.join(parts))
         
         logger.info("Generated comprehensive HTML report")
     
@@ -608,7 +723,7 @@ class ResultsAnalyzer:
         
         report_data = {
             'metadata': {
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': datetime.now(),
                 'total_benchmarks': len(df),
                 'transpilers_tested': list(df['transpiler'].unique()),
                 'datasets_tested': list(df['dataset'].unique())
@@ -631,12 +746,25 @@ class ResultsAnalyzer:
                     }
                 }
                 for s in summaries
-            ],
-            'detailed_results': df.to_dict('records')
+            ]
         }
         
-        with open(self.reports_dir / 'benchmark_report.json', 'w') as f:
-            json.dump(report_data, f, indent=2, default=str)
+        # Emit the per-result rows straight from pandas' columnar JSON writer
+        # and splice them in as the last key of the report object
+        header = json_dumps(report_data)
+        # The report keeps its datetime and dataset_size_kb fields; they are
+        # derived here since no analysis step needs them as columns
+        detailed = df.assign(
+            datetime=pd.to_datetime(df['timestamp'], unit='s'),
+            dataset_size_kb=df['dataset_size_bytes'] / 1024,
+        )
+        records = detailed.to_json(orient='records', date_format='iso', double_precision=15).encode()
+        
+        with open(self.reports_dir / 'benchmark_report.json', 'wb') as f:
+            f.write(header[:header.rindex(b'}')].rstrip())
+            f.write(b',\n  "detailed_results": ')
+            f.write(records)
+            f.write(b'\n}\n')
         
         logger.info("Generated JSON report")
     
@@ -655,13 +783,22 @@ class ResultsAnalyzer:
         # Generate summary statistics
         summaries = self.generate_summary_stats(df)
         
-        # Create visualizations
-        self.create_performance_plots(df)
-        self.create_scalability_plots(df)
-        self.create_quality_radar_chart(df)
+        # Row positions per transpiler, shared by the plots and statistical tests
+        trans_idx = self.transpiler_indices(df)
+        
+        # Create visualizations; the charts are independent and CPU-bound to
+        # render, so draw each one in its own process
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.create_performance_plots, df, trans_idx),
+                executor.submit(self.create_scalability_plots, df, trans_idx),
+                executor.submit(self.create_quality_radar_chart, df),
+            ]
+            for future in futures:
+                future.result()
         
         # Perform statistical tests
-        stats_results = self.perform_statistical_tests(df)
+        stats_results = self.perform_statistical_tests(df, trans_idx)
         
         # Generate reports
         self.generate_html_report(df, summaries, stats_results)
@@ -5,25 +5,95 @@ Measures time, memory, quality, and scalability metrics.
 """
 
 import os
+import re
 import sys
 import json
+import hashlib
+import math
 import time
 import subprocess
 import psutil
+import numpy as np
+import shutil
 import tempfile
 import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields, asdict
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
-import statistics
-import resource
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; fall back to hashlib's blake2b
+    xxhash = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# A source map's "mappings" key with a non-empty string value
+_MAPPINGS_RE = re.compile(rb'"mappings"\s*:\s*"[^"]')
+
+# Version of the cached benchmark result layout
+RESULT_CACHE_VERSION = 1
+
+# Free space /dev/shm needs before compile output is written there
+SCRATCH_MIN_FREE_BYTES = 512 * 1024 * 1024
+
+def scratch_root() -> Optional[str]:
+    """Directory for benchmark temp files: $ELLEX_BENCH_TMPDIR, else /dev/shm with headroom.
+    
+    Returns None (the platform default) when neither is usable.
+    """
+    override = os.environ.get('ELLEX_BENCH_TMPDIR')
+    if override:
+        try:
+            os.makedirs(override, exist_ok=True)
+            return override
+        except OSError as e:
+            logger.warning(f"Ignoring ELLEX_BENCH_TMPDIR={override}: {e}")
+    try:
+        if shutil.disk_usage('/dev/shm').free >= SCRATCH_MIN_FREE_BYTES:
+            return '/dev/shm'
+    except OSError:
+        pass
+    return None
+
+# Bytes of each compiler output stream kept for the result metadata
+OUTPUT_LIMIT = 64 * 1024
+
+# Diagnostic keywords in compiler output, as whole words in any case
+_DIAG_RE = re.compile(rb'\b(error|warning)\b', re.IGNORECASE)
+
+def count_diagnostics(output: bytes) -> Counter:
+    """Count 'error' and 'warning' words in compiler output in one pass."""
+    return Counter(token.lower() for token in _DIAG_RE.findall(output))
+
+# Longest unfinished line _drain holds back before counting part of it
+PENDING_LINE_LIMIT = 64 * 1024
+
+# The run of word characters at the end of a buffer
+_TRAILING_WORD_RE = re.compile(rb'\w*\Z')
+
+def _count_settled(pending: bytes, diagnostics: Counter) -> bytes:
+    """Count diagnostics in pending up to its trailing word; return what is left.
+    
+    A word cut off at the end could still grow, so it is kept. A trailing word
+    longer than any keyword can never match and shrinks to a single '_',
+    which still stops the bytes after it from starting a new word.
+    """
+    cut = _TRAILING_WORD_RE.search(pending).start()
+    diagnostics.update(count_diagnostics(pending[:cut]))
+    rest = pending[cut:]
+    return b'_' if len(rest) > len(b'warning') else rest
+
+@dataclass(slots=True, frozen=True)
 class PerformanceMetrics:
     """Performance measurement results."""
     compilation_time_ms: float
@@ -36,7 +106,7 @@ class PerformanceMetrics:
     warning_count: int
     lines_per_second: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QualityMetrics:
     """Code quality assessment results."""
     output_correctness: float      # 0-1 score for correctness
@@ -45,7 +115,7 @@ class QualityMetrics:
     error_message_quality: float  # Error message helpfulness score
     bundle_efficiency: float      # Output optimization score
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BenchmarkResult:
     """Complete benchmark result for a transpiler on a dataset."""
     transpiler: str
@@ -55,11 +125,264 @@ class BenchmarkResult:
     quality: QualityMetrics
     metadata: Dict[str, Any]
 
+@dataclass
+class OutputScan:
+    """Files and sizes found in one pass over a compile's output directory."""
+    js_count: int = 0
+    js_size_bytes: int = 0
+    output_size_bytes: int = 0      # Everything except source maps
+    source_map_size_bytes: int = 0
+    map_files: List[Path] = field(default_factory=list)
+
+# Columns produced by BenchmarkOrchestrator.run_matrix
+PERFORMANCE_FIELDS = tuple(f.name for f in fields(PerformanceMetrics))
+MATRIX_COLUMNS = ('transpiler', 'dataset', 'success') + PERFORMANCE_FIELDS
+
+def summarize_matrix(columns: Dict[str, List[Any]]) -> Dict[str, Dict[str, float]]:
+    """Per-transpiler run count, mean/std compile time and mean peak memory.
+    
+    Every transpiler is aggregated in one vectorized pass with bincount over
+    the run_matrix columns rather than a statistics call per group.
+    """
+    names, group = np.unique(np.asarray(columns['transpiler']), return_inverse=True)
+    times = np.asarray(columns['compilation_time_ms'], dtype=np.float64)
+    memory = np.asarray(columns['memory_peak_mb'], dtype=np.float64)
+    
+    counts = np.bincount(group, minlength=len(names))
+    mean_time = np.bincount(group, times, len(names)) / counts
+    sq_dev = np.bincount(group, (times - mean_time[group]) ** 2, len(names))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std_time = np.where(counts > 1, np.sqrt(sq_dev / (counts - 1)), 0.0)
+    mean_memory = np.bincount(group, memory, len(names)) / counts
+    
+    return {
+        str(name): {'runs': int(n), 'mean_time_ms': float(t), 'std_time_ms': float(sd),
+               'mean_memory_mb': float(m)}
+        for name, n, t, sd, m in zip(names, counts, mean_time, std_time, mean_memory)
+    }
+
+class RunningStats:
+    """Single-pass peak and mean of a sample stream, without keeping the samples."""
+    
+    __slots__ = ('count', 'mean', 'peak')
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.peak = 0.0
+        
+    def add(self, value: float):
+        self.count += 1
+        self.mean += (value - self.mean) / self.count
+        if self.count == 1 or value > self.peak:
+            self.peak = value
+
 class TranspilerRunner:
-    """Base class for transpiler execution."""
+    """Base class for transpiler execution.
     
-    def __init__(self, name: str):
+    Commands run in a fresh `docker run --rm` container unless `start()` has
+    launched a long-lived one, in which case they are `docker exec`'d into it
+    and skip the container start-up cost. The persistent container mounts each
+    root at the same path it has on the host, so any directory under a root
+    is addressed by its host path.
+    """
+    
+    # Invariant parts of every docker invocation
+    RUN_PREFIX = ('docker', 'run', '--rm')
+    EXEC_PREFIX = ('docker', 'exec')
+    # Seconds the host waits past an exec'd command's in-container timeout
+    EXEC_KILL_GRACE = 5
+    # Where compile() mounts the sources and the output directory
+    SOURCE_MOUNT = '/workspace/src:ro'
+    OUTPUT_MOUNT = '/workspace/dist'
+    
+    def __init__(self, name: str, image: str):
         self.name = name
+        self.image = image
+        self.container: Optional[str] = None
+        # Host roots mounted into the persistent container -> whether read-only
+        self.mount_roots: Dict[Path, bool] = {}
+        self._version: Optional[str] = None
+        self._image_id: Optional[str] = None
+        # CPUs the containers are restricted to, in docker's --cpuset-cpus syntax
+        self.cpuset: Optional[str] = None
+        self._container_shim: Optional[psutil.Process] = None
+        self._container_init_pid: Optional[int] = None
+        self._procs: Dict[int, psutil.Process] = {}
+        self._procs_lock = threading.Lock()
+        # Error/warning words seen on the stderr of every command run so far
+        self.diagnostics: Counter = Counter()
+        
+    def start(self, mount_roots: Dict[Path, bool]) -> bool:
+        """Start a persistent container for this runner.
+        
+        mount_roots maps each host root to whether it is mounted read-only.
+        """
+        mount_roots = {root.resolve(): read_only for root, read_only in mount_roots.items()}
+        name = f"bench-{self.name}-{os.getpid()}"
+        cmd = [*self.RUN_PREFIX, '-d', '--name', name, *self._cpuset_args()]
+        for root, read_only in mount_roots.items():
+            cmd.extend(['-v', f'{root}:{root}:ro' if read_only else f'{root}:{root}'])
+        cmd.extend(['--entrypoint', 'tail', self.image, '-f', '/dev/null'])
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        except Exception as e:
+            logger.warning(f"Could not start {self.name} container: {e}")
+            return False
+        if result.returncode != 0:
+            logger.warning(f"Could not start {self.name} container: {result.stderr.strip()}")
+            return False
+        
+        self.container = name
+        self.mount_roots = mount_roots
+        
+        # Exec'd commands are children of the container's shim, not of us;
+        # find it so resource sampling can see them (Linux hosts only). The
+        # container's own keep-alive process is left out of the samples.
+        try:
+            inspect = subprocess.run(['docker', 'inspect', '-f', '{{.State.Pid}}', name],
+                                     capture_output=True, text=True, timeout=10)
+            init = psutil.Process(int(inspect.stdout))
+            self._container_shim = init.parent()
+            self._container_init_pid = init.pid
+        except (ValueError, psutil.Error, subprocess.SubprocessError):
+            self._container_shim = None
+            self._container_init_pid = None
+        return True
+        
+    def stop(self):
+        """Remove the persistent container, if one is running."""
+        if self.container is None:
+            return
+        try:
+            subprocess.run(['docker', 'rm', '-f', self.container],
+                           capture_output=True, text=True, timeout=30)
+        except Exception as e:
+            logger.warning(f"Could not stop {self.name} container: {e}")
+        self.container = None
+        self.mount_roots = {}
+        self._container_shim = None
+        self._container_init_pid = None
+        
+    def _exec_into(self, mounts: Dict[Path, str]) -> bool:
+        """Whether the persistent container can see every host path in mounts.
+        
+        Paths mounted writable must lie under a root that is not read-only.
+        """
+        if self.container is None:
+            return False
+        for host, dest in mounts.items():
+            host = host.resolve()
+            # The innermost mount containing a path decides whether it is writable
+            roots = [root for root in self.mount_roots if host.is_relative_to(root)]
+            if not roots:
+                return False
+            if self.mount_roots[max(roots, key=lambda root: len(root.parts))] and not dest.endswith(':ro'):
+                return False
+        return True
+        
+    def _container_paths(self, mounts: Dict[Path, str]) -> List[str]:
+        """Paths at which the host directories in mounts appear in the container."""
+        if self._exec_into(mounts):
+            return [str(host.resolve()) for host in mounts]
+        return [dest.split(':')[0] for dest in mounts.values()]
+        
+    def _run(self, cmd: List[str], timeout: float) -> Tuple[bool, str, str]:
+        """Run cmd to completion, tracking its process while it runs.
+        
+        Only the first OUTPUT_LIMIT bytes of each stream are kept; the rest is
+        drained and discarded, with stderr diagnostics counted on the way into
+        `self.diagnostics`.
+        
+        Killing a `docker exec` client leaves its command running in the
+        container, so exec'd commands are wrapped in the container's own
+        `timeout -s KILL` and the host waits EXEC_KILL_GRACE seconds longer.
+        """
+        exec_prefix = [*self.EXEC_PREFIX, self.container]
+        in_container = self.container is not None and cmd[:len(exec_prefix)] == exec_prefix
+        wait_timeout = timeout
+        if in_container:
+            cmd = [*exec_prefix, 'timeout', '-s', 'KILL', str(math.ceil(timeout)),
+                   *cmd[len(exec_prefix):]]
+            wait_timeout = timeout + self.EXEC_KILL_GRACE
+        
+        start = time.monotonic()
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        with self._procs_lock:
+            self._procs[process.pid] = psutil.Process(process.pid)
+        
+        stdout, stderr = bytearray(), bytearray()
+        diagnostics = Counter()
+        readers = [
+            threading.Thread(target=self._drain, args=(process.stdout, stdout, None)),
+            threading.Thread(target=self._drain, args=(process.stderr, stderr, diagnostics)),
+        ]
+        for reader in readers:
+            reader.start()
+        
+        try:
+            process.wait(timeout=wait_timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join()
+            with self._procs_lock:
+                del self._procs[process.pid]
+                self.diagnostics.update(diagnostics)
+        
+        # SIGKILL from the in-container timeout surfaces as exit status 137
+        if in_container and process.returncode == 137 and time.monotonic() - start >= timeout:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        
+        return (process.returncode == 0,
+                stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace'))
+        
+    @staticmethod
+    def _drain(pipe, head: bytearray, diagnostics: Optional[Counter]):
+        """Read pipe to EOF, keeping its first OUTPUT_LIMIT bytes in head."""
+        partial = b''
+        with pipe:
+            while chunk := pipe.read(65536):
+                if len(head) < OUTPUT_LIMIT:
+                    head += chunk[:OUTPUT_LIMIT - len(head)]
+                if diagnostics is not None:
+                    # Diagnostics never span lines; hold back the unfinished one,
+                    # counting all but its last word once it grows past the limit
+                    lines, newline, partial = (partial + chunk).rpartition(b'\n')
+                    diagnostics.update(count_diagnostics(lines))
+                    if len(partial) > PENDING_LINE_LIMIT:
+                        partial = _count_settled(partial, diagnostics)
+        if diagnostics is not None:
+            diagnostics.update(count_diagnostics(partial))
+        
+    def processes(self) -> List[psutil.Process]:
+        """Root processes whose trees hold the work of the running compile."""
+        with self._procs_lock:
+            procs = list(self._procs.values())
+        if self._container_shim is not None:
+            try:
+                procs.extend(proc for proc in self._container_shim.children()
+                             if proc.pid != self._container_init_pid)
+            except psutil.Error:
+                pass
+        return procs
+        
+    def _cpuset_args(self) -> List[str]:
+        """docker run flags restricting the container to self.cpuset."""
+        return ['--cpuset-cpus', self.cpuset] if self.cpuset else []
+        
+    def _command(self, mounts: Dict[Path, str], argv: List[str]) -> List[str]:
+        """Build the docker command running argv with mounts (host -> container[:mode])."""
+        if self._exec_into(mounts):
+            return [*self.EXEC_PREFIX, self.container, *argv]
+        cmd = [*self.RUN_PREFIX, *self._cpuset_args()]
+        for host, dest in mounts.items():
+            cmd.extend(['-v', f'{host}:{dest}'])
+        return cmd + [self.image, *argv]
         
     def compile(self, source_dir: Path, output_dir: Path, options: Dict) -> Tuple[bool, str, str]:
         """Compile source code and return (success, stdout, stderr)."""
@@ -69,15 +392,37 @@ class TranspilerRunner:
         """Whether this transpiler supports source map generation."""
         return True
         
-    def get_version(self) -> str:
-        """Get transpiler version string."""
+    def get_version(self, query: bool = True) -> str:
+        """Get transpiler version string, querying the image only once.
+        
+        With query=False an unknown version is not looked up.
+        """
+        if self._version is None:
+            if not query:
+                return "unknown"
+            self._version = self._query_version()
+        return self._version
+        
+    def _query_version(self) -> str:
+        """Ask the transpiler for its version string."""
         raise NotImplementedError
+        
+    def image_id(self) -> str:
+        """ID of the runner's docker image, read from image metadata without starting a container."""
+        if self._image_id is None:
+            try:
+                result = subprocess.run(['docker', 'image', 'inspect', '--format', '{{.Id}}', self.image],
+                                        capture_output=True, text=True, timeout=10)
+                self._image_id = result.stdout.strip() or "unknown"
+            except Exception:
+                self._image_id = "unknown"
+        return self._image_id
 
 class EllexRunner(TranspilerRunner):
     """Ellex transpiler runner."""
     
     def __init__(self):
-        super().__init__("ellex")
+        super().__init__("ellex", "benchmark-ellex")
         
     def compile(self, source_dir: Path, output_dir: Path, options: Dict) -> Tuple[bool, str, str]:
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -87,7 +432,7 @@ class EllexRunner(TranspilerRunner):
         ellex_files = []
         
         # Convert TS to Ellex (reverse transpilation for testing)
-        for ts_file in ts_files[:10]:  # Limit for testing
+        for i, ts_file in enumerate(ts_files[:10]):  # Limit for testing
             try:
                 with open(ts_file, 'r', encoding='utf-8', errors='ignore') as f:
                     ts_content = f.read()
@@ -95,7 +440,9 @@ class EllexRunner(TranspilerRunner):
                 # Simple TS -> Ellex conversion for benchmarking
                 ellex_content = self._convert_ts_to_ellex(ts_content)
                 
-                ellex_file = output_dir / f"{ts_file.stem}.ellex"
+                # Prefix the index so same-stem files (src/index.ts, lib/index.ts)
+                # don't share an .ellex or .js path across concurrent runs
+                ellex_file = output_dir / f"{i}_{ts_file.stem}.ellex"
                 with open(ellex_file, 'w') as f:
                     f.write(ellex_content)
                     
@@ -107,41 +454,19 @@ class EllexRunner(TranspilerRunner):
         if not ellex_files:
             return False, "", "No files to transpile"
         
-        # Now transpile Ellex to JavaScript
+        # Now transpile Ellex to JavaScript; each file is its own container
+        # run, so overlap them rather than paying startup latency serially
         success_count = 0
         all_stdout = []
         all_stderr = []
         
-        for ellex_file in ellex_files:
-            js_output = output_dir / f"{ellex_file.stem}.js"
-            
-            cmd = [
-                'docker', 'run', '--rm',
-                '-v', f'{ellex_file.parent}:/workspace',
-                'benchmark-ellex',
-                'ellex', 'transpile',
-                '-i', f'/workspace/{ellex_file.name}',
-                '-o', f'/workspace/{js_output.name}',
-                '-t', 'javascript'
-            ]
-            
-            if options.get('optimize', False):
-                cmd.append('--optimize')
-            if options.get('minify', False):
-                cmd.append('--minify')
-            
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                all_stdout.append(result.stdout)
-                all_stderr.append(result.stderr)
-                
-                if result.returncode == 0:
+        with ThreadPoolExecutor(max_workers=min(8, len(ellex_files))) as executor:
+            outcomes = executor.map(lambda f: self._transpile_one(f, output_dir, options), ellex_files)
+            for ok, stdout, stderr in outcomes:
+                all_stdout.append(stdout)
+                all_stderr.append(stderr)
+                if ok:
                     success_count += 1
-                    
-            except subprocess.TimeoutExpired:
-                all_stderr.append(f"Timeout compiling {ellex_file}")
-            except Exception as e:
-                all_stderr.append(f"Error compiling {ellex_file}: {e}")
         
         success = success_count > 0
         stdout = '\n'.join(all_stdout)
@@ -149,51 +474,60 @@ class EllexRunner(TranspilerRunner):
         
         return success, stdout, stderr
     
+    def _transpile_one(self, ellex_file: Path, output_dir: Path, options: Dict) -> Tuple[bool, str, str]:
+        """Transpile a single .ellex file and return (success, stdout, stderr)."""
+        js_output = output_dir / f"{ellex_file.stem}.js"
+        
+        mounts = {ellex_file.parent: '/workspace'}
+        (workspace,) = self._container_paths(mounts)
+        cmd = self._command(mounts, [
+            'ellex', 'transpile',
+            '-i', f'{workspace}/{ellex_file.name}',
+            '-o', f'{workspace}/{js_output.name}',
+            '-t', 'javascript'
+        ])
+        
+        if options.get('optimize', False):
+            cmd.append('--optimize')
+        if options.get('minify', False):
+            cmd.append('--minify')
+        
+        try:
+            return self._run(cmd, timeout=30)
+        except subprocess.TimeoutExpired:
+            return False, "", f"Timeout compiling {ellex_file}"
+        except Exception as e:
+            return False, "", f"Error compiling {ellex_file}: {e}"
+    
     def _convert_ts_to_ellex(self, ts_content: str) -> str:
         """Simple TypeScript to Ellex conversion for benchmarking."""
-        lines = ts_content.split('\n')
-        ellex_lines = []
+        ellex_lines = ['tell "Converted from TypeScript"']
+        append = ellex_lines.append
         
-        for line in lines:
-            stripped = line.strip()
-            
+        for stripped in map(str.strip, ts_content.split('\n')):
             # Convert console.log() to tell
             if 'console.log(' in stripped:
                 start = stripped.find('console.log(') + 12
                 end = stripped.rfind(')')
                 if end > start:
-                    content = stripped[start:end]
-                    ellex_lines.append(f'tell {content}')
-                continue
-            
-            # Convert simple variable declarations
-            if stripped.startswith('const ') or stripped.startswith('let '):
-                # Simple conversion - not comprehensive
-                ellex_lines.append(f'# {stripped}')
-                continue
+                    append(f'tell {stripped[start:end]}')
             
             # Convert if statements
-            if stripped.startswith('if ('):
-                ellex_lines.append(f'# Conditional: {stripped}')
-                continue
-                
-            # Skip empty lines and comments
-            if not stripped or stripped.startswith('//') or stripped.startswith('/*'):
-                continue
-                
-            # Default: comment out complex TypeScript
-            if stripped:
-                ellex_lines.append(f'# {stripped}')
+            elif stripped.startswith('if ('):
+                append(f'# Conditional: {stripped}')
+            
+            # Skip empty lines and comments; comment out declarations and
+            # any other complex TypeScript
+            elif stripped and not stripped.startswith(('//', '/*')):
+                append(f'# {stripped}')
         
-        # Add some basic Ellex content
-        ellex_lines.insert(0, 'tell "Converted from TypeScript"')
-        ellex_lines.append('tell "Conversion complete"')
+        append('tell "Conversion complete"')
         
         return '\n'.join(ellex_lines)
     
-    def get_version(self) -> str:
+    def _query_version(self) -> str:
         try:
-            result = subprocess.run(['docker', 'run', '--rm', 'benchmark-ellex', 'ellex', '--version'], 
+            result = subprocess.run(self._command({}, ['ellex', '--version']),
                                   capture_output=True, text=True, timeout=10)
             return result.stdout.strip()
         except:
@@ -202,35 +536,34 @@ class EllexRunner(TranspilerRunner):
 class SWCRunner(TranspilerRunner):
     """SWC transpiler runner."""
     
+    # swc.config.js is copied into the benchmark-swc image at build time
+    CONFIG_ARGS = ('--config-file', '/workspace/swc.config.js')
+    
     def __init__(self):
-        super().__init__("swc")
+        super().__init__("swc", "benchmark-swc")
         
     def compile(self, source_dir: Path, output_dir: Path, options: Dict) -> Tuple[bool, str, str]:
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        cmd = [
-            'docker', 'run', '--rm',
-            '-v', f'{source_dir}:/workspace/src:ro',
-            '-v', f'{output_dir}:/workspace/dist',
-            'benchmark-swc',
-            'swc', 'src', '--out-dir', 'dist',
-            '--config-file', '/workspace/swc.config.js'
-        ]
+        mounts = {source_dir: self.SOURCE_MOUNT, output_dir: self.OUTPUT_MOUNT}
+        src, dist = self._container_paths(mounts)
+        cmd = self._command(mounts, [
+            'swc', src, '--out-dir', dist, *self.CONFIG_ARGS
+        ])
         
         if options.get('source_maps', True):
             cmd.extend(['--source-maps', 'true'])
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-            return result.returncode == 0, result.stdout, result.stderr
+            return self._run(cmd, timeout=120)
         except subprocess.TimeoutExpired:
             return False, "", "Compilation timeout"
         except Exception as e:
             return False, "", str(e)
     
-    def get_version(self) -> str:
+    def _query_version(self) -> str:
         try:
-            result = subprocess.run(['docker', 'run', '--rm', 'benchmark-swc', 'swc', '--version'], 
+            result = subprocess.run(self._command({}, ['swc', '--version']),
                                   capture_output=True, text=True, timeout=10)
             return result.stdout.strip()
         except:
@@ -240,34 +573,31 @@ class TSCRunner(TranspilerRunner):
     """TypeScript compiler runner."""
     
     def __init__(self):
-        super().__init__("tsc")
+        super().__init__("tsc", "benchmark-tsc")
         
     def compile(self, source_dir: Path, output_dir: Path, options: Dict) -> Tuple[bool, str, str]:
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        cmd = [
-            'docker', 'run', '--rm',
-            '-v', f'{source_dir}:/workspace/src:ro',
-            '-v', f'{output_dir}:/workspace/dist',
-            'benchmark-tsc',
-            'tsc', '--project', '/workspace/src',
-            '--outDir', '/workspace/dist'
-        ]
+        mounts = {source_dir: self.SOURCE_MOUNT, output_dir: self.OUTPUT_MOUNT}
+        src, dist = self._container_paths(mounts)
+        cmd = self._command(mounts, [
+            'tsc', '--project', src,
+            '--outDir', dist
+        ])
         
         if not options.get('source_maps', True):
             cmd.append('--sourceMap false')
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            return result.returncode == 0, result.stdout, result.stderr
+            return self._run(cmd, timeout=300)
         except subprocess.TimeoutExpired:
             return False, "", "Compilation timeout"
         except Exception as e:
             return False, "", str(e)
     
-    def get_version(self) -> str:
+    def _query_version(self) -> str:
         try:
-            result = subprocess.run(['docker', 'run', '--rm', 'benchmark-tsc', 'tsc', '--version'], 
+            result = subprocess.run(self._command({}, ['tsc', '--version']),
                                   capture_output=True, text=True, timeout=10)
             return result.stdout.strip()
         except:
@@ -277,34 +607,31 @@ class BabelRunner(TranspilerRunner):
     """Babel transpiler runner."""
     
     def __init__(self):
-        super().__init__("babel")
+        super().__init__("babel", "benchmark-babel")
         
     def compile(self, source_dir: Path, output_dir: Path, options: Dict) -> Tuple[bool, str, str]:
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        cmd = [
-            'docker', 'run', '--rm',
-            '-v', f'{source_dir}:/workspace/src:ro',
-            '-v', f'{output_dir}:/workspace/dist',
-            'benchmark-babel',
-            'babel', 'src', '--out-dir', 'dist',
+        mounts = {source_dir: self.SOURCE_MOUNT, output_dir: self.OUTPUT_MOUNT}
+        src, dist = self._container_paths(mounts)
+        cmd = self._command(mounts, [
+            'babel', src, '--out-dir', dist,
             '--extensions', '.ts,.tsx,.js,.jsx'
-        ]
+        ])
         
         if options.get('source_maps', True):
             cmd.append('--source-maps')
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=180)
-            return result.returncode == 0, result.stdout, result.stderr
+            return self._run(cmd, timeout=180)
         except subprocess.TimeoutExpired:
             return False, "", "Compilation timeout"
         except Exception as e:
             return False, "", str(e)
     
-    def get_version(self) -> str:
+    def _query_version(self) -> str:
         try:
-            result = subprocess.run(['docker', 'run', '--rm', 'benchmark-babel', 'babel', '--version'], 
+            result = subprocess.run(self._command({}, ['babel', '--version']),
                                   capture_output=True, text=True, timeout=10)
             return result.stdout.strip()
         except:
@@ -314,7 +641,7 @@ class ESBuildRunner(TranspilerRunner):
     """esbuild transpiler runner."""
     
     def __init__(self):
-        super().__init__("esbuild")
+        super().__init__("esbuild", "benchmark-esbuild")
         
     def compile(self, source_dir: Path, output_dir: Path, options: Dict) -> Tuple[bool, str, str]:
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -330,16 +657,14 @@ class ESBuildRunner(TranspilerRunner):
         
         entry_point = entry_points[0]
         
-        cmd = [
-            'docker', 'run', '--rm',
-            '-v', f'{source_dir}:/workspace/src:ro',
-            '-v', f'{output_dir}:/workspace/dist',
-            'benchmark-esbuild',
-            'esbuild', f'/workspace/src/{entry_point.relative_to(source_dir)}',
-            '--outdir=/workspace/dist',
+        mounts = {source_dir: self.SOURCE_MOUNT, output_dir: self.OUTPUT_MOUNT}
+        src, dist = self._container_paths(mounts)
+        cmd = self._command(mounts, [
+            'esbuild', f'{src}/{entry_point.relative_to(source_dir)}',
+            f'--outdir={dist}',
             '--format=esm',
             '--target=es2020'
-        ]
+        ])
         
         if options.get('source_maps', True):
             cmd.append('--sourcemap')
@@ -348,16 +673,15 @@ class ESBuildRunner(TranspilerRunner):
             cmd.append('--minify')
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            return result.returncode == 0, result.stdout, result.stderr
+            return self._run(cmd, timeout=60)
         except subprocess.TimeoutExpired:
             return False, "", "Compilation timeout"
         except Exception as e:
             return False, "", str(e)
     
-    def get_version(self) -> str:
+    def _query_version(self) -> str:
         try:
-            result = subprocess.run(['docker', 'run', '--rm', 'benchmark-esbuild', 'esbuild', '--version'], 
+            result = subprocess.run(self._command({}, ['esbuild', '--version']),
                                   capture_output=True, text=True, timeout=10)
             return result.stdout.strip()
         except:
@@ -366,9 +690,15 @@ class ESBuildRunner(TranspilerRunner):
 class BenchmarkOrchestrator:
     """Main benchmark orchestration and measurement."""
     
-    def __init__(self, results_dir: Path = Path('./results')):
+    def __init__(self, results_dir: Path = Path('./results'), reuse_results: bool = False,
+                 concurrent: bool = False):
         self.results_dir = results_dir
         self.results_dir.mkdir(exist_ok=True)
+        # Serve repeated (transpiler version, dataset contents, options) runs from disk
+        self.reuse_results = reuse_results
+        # Opt-in: run a dataset's transpilers at once; their timings then include contention
+        self.concurrent = concurrent
+        self.cache_dir = results_dir / 'cache'
         
         self.runners = {
             'ellex': EllexRunner(),
@@ -378,107 +708,190 @@ class BenchmarkOrchestrator:
             'esbuild': ESBuildRunner()
         }
     
-    def measure_performance(self, runner: TranspilerRunner, source_dir: Path, 
-                          options: Dict, dataset_stats: Dict) -> PerformanceMetrics:
-        """Measure transpiler performance metrics."""
+    def pin(self, cpus: List[int], niceness: int = -5):
+        """Pin the orchestrator and its containers to cpus to steady timings.
+        
+        Affinity and raised priority are Linux-only and the priority boost needs
+        CAP_SYS_NICE; without them a warning is logged and benchmarks still run.
+        Call before start() so the persistent containers get the CPU set too.
+        """
+        cpuset = ','.join(str(cpu) for cpu in cpus)
+        for runner in self.runners.values():
+            runner.cpuset = cpuset
+        
+        if hasattr(os, 'sched_setaffinity'):
+            try:
+                os.sched_setaffinity(0, set(cpus))
+            except OSError as e:
+                logger.warning(f"Could not pin benchmark runner to CPUs {cpuset}: {e}")
+        else:
+            logger.warning("CPU affinity is not supported on this platform")
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_dir = Path(temp_dir) / 'output'
-            
-            # Monitor process during compilation
-            memory_samples = []
-            cpu_samples = []
-            monitor_active = threading.Event()
-            monitor_active.set()
-            
-            def monitor_resources():
-                process = psutil.Process()
-                while monitor_active.is_set():
+        try:
+            os.nice(niceness)
+        except (OSError, AttributeError) as e:
+            logger.warning(f"Could not raise benchmark runner priority: {e}")
+    
+    def start(self, transpilers: List[str], dataset_root: Path = Path('./datasets')):
+        """Start a persistent container for each of the given transpilers' runners.
+        
+        The containers mount the dataset root read-only and the scratch
+        directory writable, which together hold every source and output
+        directory a benchmark uses. Runners whose container fails to start,
+        and runners not started at all, use one-shot containers.
+        """
+        runners = [self.runners[t] for t in transpilers if t in self.runners]
+        if not runners:
+            return
+        mount_roots = {dataset_root: True, Path(scratch_root() or tempfile.gettempdir()): False}
+        with ThreadPoolExecutor(max_workers=len(runners)) as executor:
+            list(executor.map(lambda runner: runner.start(mount_roots), runners))
+    
+    def close(self):
+        """Stop the runners' persistent containers."""
+        with ThreadPoolExecutor(max_workers=len(self.runners)) as executor:
+            list(executor.map(lambda runner: runner.stop(), self.runners.values()))
+    
+    def measure_performance(self, runner: TranspilerRunner, source_dir: Path, output_dir: Path,
+                          options: Dict, dataset_stats: Dict
+                          ) -> Tuple[PerformanceMetrics, bool, str, str, OutputScan]:
+        """Compile into output_dir, measuring transpiler performance metrics.
+        
+        Returns the metrics together with the compile's (success, stdout, stderr)
+        and the scan of its output, so the quality phase can reuse the output.
+        """
+        
+        # Monitor the compile's process trees during compilation
+        memory_stats = RunningStats()
+        cpu_stats = RunningStats()
+        monitor_stop = threading.Event()
+        
+        def monitor_resources():
+            # Reuse Process objects so cpu_percent() measures since the last sample
+            seen: Dict[int, psutil.Process] = {}
+            while True:
+                rss = 0
+                cpu = 0.0
+                for root in runner.processes():
                     try:
-                        mem_info = process.memory_info()
-                        memory_samples.append(mem_info.rss / 1024 / 1024)  # MB
-                        cpu_samples.append(process.cpu_percent())
-                        time.sleep(0.1)
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        break
-            
+                        tree = [root, *root.children(recursive=True)]
+                    except psutil.Error:
+                        continue
+                    for proc in tree:
+                        proc = seen.setdefault(proc.pid, proc)
+                        try:
+                            rss += proc.memory_info().rss
+                            cpu += proc.cpu_percent()
+                        except psutil.Error:
+                            continue
+                memory_stats.add(rss / 1024 / 1024)  # MB
+                cpu_stats.add(cpu)
+                if monitor_stop.wait(0.1):
+                    break
+        
+        # Quick runs skip sampling; memory and CPU then report zero
+        monitor_thread = None
+        if not options.get('quick', False):
             monitor_thread = threading.Thread(target=monitor_resources)
             monitor_thread.start()
-            
-            # Time the compilation
-            start_time = time.perf_counter()
-            start_rusage = resource.getrusage(resource.RUSAGE_CHILDREN)
-            
-            success, stdout, stderr = runner.compile(source_dir, output_dir, options)
-            
-            end_time = time.perf_counter()
-            end_rusage = resource.getrusage(resource.RUSAGE_CHILDREN)
-            
-            # Stop monitoring
-            monitor_active.clear()
+        
+        # Time the compilation
+        runner.diagnostics.clear()
+        start_time = time.perf_counter()
+        
+        success, stdout, stderr = runner.compile(source_dir, output_dir, options)
+        
+        end_time = time.perf_counter()
+        
+        # Stop monitoring
+        if monitor_thread is not None:
+            monitor_stop.set()
             monitor_thread.join(timeout=1)
-            
-            compilation_time_ms = (end_time - start_time) * 1000
-            
-            # Calculate memory usage
-            memory_peak_mb = max(memory_samples) if memory_samples else 0
-            memory_avg_mb = statistics.mean(memory_samples) if memory_samples else 0
-            cpu_percent = statistics.mean(cpu_samples) if cpu_samples else 0
-            
-            # Measure output size
-            output_size_bytes = 0
-            source_map_size_bytes = 0
-            
-            if output_dir.exists():
-                for file_path in output_dir.rglob('*'):
-                    if file_path.is_file():
-                        size = file_path.stat().st_size
-                        if file_path.suffix == '.map':
-                            source_map_size_bytes += size
-                        else:
-                            output_size_bytes += size
-            
-            # Count errors and warnings
-            error_count = stderr.lower().count('error') if stderr else 0
-            warning_count = stderr.lower().count('warning') if stderr else 0
-            
-            # Calculate throughput
-            total_lines = dataset_stats.get('total_lines', 1)
-            lines_per_second = total_lines / (compilation_time_ms / 1000) if compilation_time_ms > 0 else 0
-            
-            return PerformanceMetrics(
-                compilation_time_ms=compilation_time_ms,
-                memory_peak_mb=memory_peak_mb,
-                memory_avg_mb=memory_avg_mb,
-                cpu_percent=cpu_percent,
-                output_size_bytes=output_size_bytes,
-                source_map_size_bytes=source_map_size_bytes,
-                error_count=error_count,
-                warning_count=warning_count,
-                lines_per_second=lines_per_second
-            )
+        
+        compilation_time_ms = (end_time - start_time) * 1000
+        
+        # Calculate memory usage
+        memory_peak_mb = memory_stats.peak
+        memory_avg_mb = memory_stats.mean
+        cpu_percent = cpu_stats.mean
+        
+        # Measure output size
+        scan = self._scan_output(output_dir)
+        
+        # Count errors and warnings over the full stderr streams
+        error_count = runner.diagnostics[b'error']
+        warning_count = runner.diagnostics[b'warning']
+        
+        # Calculate throughput
+        total_lines = dataset_stats.get('total_lines', 1)
+        lines_per_second = total_lines / (compilation_time_ms / 1000) if compilation_time_ms > 0 else 0
+        
+        performance = PerformanceMetrics(
+            compilation_time_ms=compilation_time_ms,
+            memory_peak_mb=memory_peak_mb,
+            memory_avg_mb=memory_avg_mb,
+            cpu_percent=cpu_percent,
+            output_size_bytes=scan.output_size_bytes,
+            source_map_size_bytes=scan.source_map_size_bytes,
+            error_count=error_count,
+            warning_count=warning_count,
+            lines_per_second=lines_per_second
+        )
+        return performance, success, stdout, stderr, scan
+    
+    def _scan_output(self, output_dir: Path) -> OutputScan:
+        """Walk output_dir once, binning files by suffix and summing their sizes."""
+        scan = OutputScan()
+        pending = [output_dir]
+        
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    
+                    size = entry.stat().st_size
+                    if entry.name.endswith('.map'):
+                        scan.map_files.append(Path(entry.path))
+                        scan.source_map_size_bytes += size
+                    else:
+                        scan.output_size_bytes += size
+                        if entry.name.endswith('.js'):
+                            scan.js_count += 1
+                            scan.js_size_bytes += size
+        
+        return scan
     
     def measure_quality(self, runner: TranspilerRunner, source_dir: Path, 
-                       output_dir: Path, dataset_stats: Dict) -> QualityMetrics:
+                       output_dir: Path, dataset_stats: Dict,
+                       scan: Optional[OutputScan] = None) -> QualityMetrics:
         """Measure code quality metrics."""
         
+        if scan is None:
+            scan = self._scan_output(output_dir)
+        
         # Simple quality assessment (can be extended)
         output_correctness = 1.0  # Assume correct if compilation succeeded
         
         # Runtime performance test (simplified)
-        runtime_performance = self._measure_runtime_performance(output_dir)
+        runtime_performance = self._measure_runtime_performance(scan)
         
         # Source map accuracy (basic check)
-        source_map_accuracy = self._assess_source_maps(output_dir)
+        source_map_accuracy = self._assess_source_maps(scan)
         
         # Error message quality (based on stderr helpfulness)
         error_message_quality = 0.8  # Default good score
         
         # Bundle efficiency (size relative to source)
         source_size = dataset_stats.get('total_size_bytes', 1)
-        output_files = list(output_dir.rglob('*.js')) if output_dir.exists() else []
-        output_size = sum(f.stat().st_size for f in output_files)
-        bundle_efficiency = min(1.0, source_size / max(output_size, 1))
+        bundle_efficiency = min(1.0, source_size / max(scan.js_size_bytes, 1))
         
         return QualityMetrics(
             output_correctness=output_correctness,
@@ -488,16 +901,14 @@ class BenchmarkOrchestrator:
             bundle_efficiency=bundle_efficiency
         )
     
-    def _measure_runtime_performance(self, output_dir: Path) -> float:
+    def _measure_runtime_performance(self, scan: OutputScan) -> float:
         """Measure runtime performance of generated code."""
         # Simplified runtime test - could be expanded
-        js_files = list(output_dir.rglob('*.js')) if output_dir.exists() else []
-        
-        if not js_files:
+        if not scan.js_count:
             return 0.0
         
         # Basic performance score based on output characteristics
-        total_size = sum(f.stat().st_size for f in js_files)
+        total_size = scan.js_size_bytes
         
         # Smaller, cleaner output generally performs better
         if total_size < 10000:  # < 10KB
@@ -509,30 +920,19 @@ class BenchmarkOrchestrator:
         else:
             return 0.4
     
-    def _assess_source_maps(self, output_dir: Path) -> float:
+    def _assess_source_maps(self, scan: OutputScan) -> float:
         """Assess source map quality."""
-        if not output_dir.exists():
-            return 0.0
+        map_files = scan.map_files
         
-        map_files = list(output_dir.rglob('*.map'))
-        js_files = list(output_dir.rglob('*.js'))
-        
-        if not js_files:
+        if not scan.js_count:
             return 0.0
         
         # Check if source maps exist for JavaScript files
-        map_coverage = len(map_files) / len(js_files)
+        map_coverage = len(map_files) / scan.js_count
         
         # Basic quality check - ensure maps are not empty
-        valid_maps = 0
-        for map_file in map_files:
-            try:
-                with open(map_file, 'r') as f:
-                    map_data = json.load(f)
-                    if 'mappings' in map_data and map_data['mappings']:
-                        valid_maps += 1
-            except:
-                continue
+        buffer = bytearray(65536)  # Shared read buffer for every map file
+        valid_maps = sum(self._has_mappings(map_file, buffer) for map_file in map_files)
         
         if map_files:
             map_validity = valid_maps / len(map_files)
@@ -541,6 +941,30 @@ class BenchmarkOrchestrator:
         
         return (map_coverage + map_validity) / 2
     
+    def _has_mappings(self, map_file: Path, buffer: bytearray, overlap: int = 64) -> bool:
+        """Whether a source map has non-empty mappings, without parsing it.
+        
+        Maps can be megabytes of VLQ data and embedded sources, so the file is
+        read into `buffer` chunk by chunk and reading stops as soon as the key
+        is found. The last `overlap` bytes of each chunk are carried over so a
+        key split across two reads is still matched.
+        """
+        view = memoryview(buffer)
+        kept = 0
+        try:
+            with open(map_file, 'rb', buffering=0) as f:
+                while read := f.readinto(view[kept:]):
+                    end = kept + read
+                    if _MAPPINGS_RE.search(buffer, 0, end):
+                        return True
+                    kept = min(overlap, end)
+                    buffer[:kept] = buffer[end - kept:end]
+        except OSError:
+            pass
+        finally:
+            view.release()
+        return False
+    
     def run_benchmark(self, transpiler: str, dataset_path: Path, 
                      dataset_stats: Dict, options: Dict = None) -> BenchmarkResult:
         """Run complete benchmark for a transpiler on a dataset."""
@@ -553,15 +977,20 @@ class BenchmarkOrchestrator:
         
         logger.info(f"Running {transpiler} benchmark on {dataset_path.name}")
         
-        # Measure performance
-        performance = self.measure_performance(runner, dataset_path, options, dataset_stats)
+        if self.reuse_results:
+            cache_path = self._result_cache_path(runner, dataset_path, options)
+            if cache_path.exists():
+                logger.info(f"Reusing cached {transpiler} result for {dataset_path.name}")
+                return self._load_result(cache_path)
         
-        # Measure quality (create temporary output for assessment)
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Compile once; the quality phase assesses the same output. Output goes
+        # to shared memory when possible, since tsc/babel write thousands of files
+        with tempfile.TemporaryDirectory(dir=scratch_root()) as temp_dir:
             output_dir = Path(temp_dir) / 'output'
-            success, stdout, stderr = runner.compile(dataset_path, output_dir, options)
+            performance, success, stdout, stderr, scan = self.measure_performance(
+                runner, dataset_path, output_dir, options, dataset_stats)
             
-            quality = self.measure_quality(runner, dataset_path, output_dir, dataset_stats)
+            quality = self.measure_quality(runner, dataset_path, output_dir, dataset_stats, scan)
         
         # Create result
         result = BenchmarkResult(
@@ -572,7 +1001,7 @@ class BenchmarkOrchestrator:
             quality=quality,
             metadata={
                 'success': success,
-                'transpiler_version': runner.get_version(),
+                'transpiler_version': runner.get_version(query=not options.get('quick', False)),
                 'options': options,
                 'dataset_stats': dataset_stats,
                 'stdout': stdout[:1000],  # Truncate
@@ -582,30 +1011,129 @@ class BenchmarkOrchestrator:
         
         # Save result
         result_file = self.results_dir / f"{transpiler}_{dataset_path.name}_{int(time.time())}.json"
-        with open(result_file, 'w') as f:
-            json.dump(asdict(result), f, indent=2)
+        self._write_result(result_file, result)
+        if self.reuse_results:
+            self.cache_dir.mkdir(exist_ok=True)
+            self._write_result(cache_path, result)
         
         logger.info(f"Benchmark complete: {performance.compilation_time_ms:.1f}ms, "
                    f"{performance.memory_peak_mb:.1f}MB peak memory")
         
         return result
     
+    def _write_result(self, path: Path, result: BenchmarkResult):
+        """Serialize a benchmark result as indented JSON."""
+        if orjson:
+            # orjson serializes the dataclasses directly, without an asdict() copy
+            path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                json.dump(asdict(result), f, indent=2)
+    
+    def _load_result(self, path: Path) -> BenchmarkResult:
+        """Rebuild a benchmark result written by _write_result."""
+        data = path.read_bytes()
+        data = orjson.loads(data) if orjson else json.loads(data)
+        return BenchmarkResult(
+            transpiler=data['transpiler'],
+            dataset=data['dataset'],
+            timestamp=data['timestamp'],
+            performance=PerformanceMetrics(**data['performance']),
+            quality=QualityMetrics(**data['quality']),
+            metadata=data['metadata']
+        )
+    
+    def _dataset_hash(self, dataset_path: Path):
+        """Fingerprint a dataset from the paths, sizes and mtimes of its files."""
+        digest = xxhash.xxh3_64() if xxhash else hashlib.blake2b(digest_size=8)
+        pending = [dataset_path]
+        
+        while pending:
+            directory = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        rel_path = os.path.relpath(entry.path, dataset_path)
+                        digest.update(f"{rel_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        
+        return digest
+    
+    def _result_cache_path(self, runner: TranspilerRunner, dataset_path: Path, options: Dict) -> Path:
+        """Cache file for a (transpiler version, dataset contents, options) combination.
+        
+        Quick runs don't look the version up; the image ID stands in for it.
+        """
+        digest = self._dataset_hash(dataset_path)
+        version = runner.image_id() if options.get('quick', False) else runner.get_version()
+        key = (RESULT_CACHE_VERSION, runner.name, version, sorted(options.items()))
+        digest.update(repr(key).encode())
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+    
     def run_comparative_benchmark(self, dataset_path: Path, dataset_stats: Dict,
-                                transpilers: List[str] = None) -> List[BenchmarkResult]:
-        """Run benchmarks for multiple transpilers on the same dataset."""
+                                transpilers: List[str] = None,
+                                options: Dict = None,
+                                raise_errors: bool = False) -> List[BenchmarkResult]:
+        """Run benchmarks for multiple transpilers on the same dataset.
         
-        transpilers = transpilers or list(self.runners.keys())
-        results = []
+        Transpilers run one after another so each one's timings are taken on an
+        otherwise idle machine, unless the orchestrator was created with
+        concurrent=True. Results are returned in the order of `transpilers`.
+        A failing transpiler is logged and skipped unless raise_errors is set.
+        """
         
-        for transpiler in transpilers:
-            try:
-                result = self.run_benchmark(transpiler, dataset_path, dataset_stats)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Benchmark failed for {transpiler}: {e}")
-                continue
+        transpilers = transpilers or list(self.runners.keys())
         
-        return results
+        if not self.concurrent:
+            results = []
+            for transpiler in transpilers:
+                try:
+                    results.append(self.run_benchmark(transpiler, dataset_path, dataset_stats, options))
+                except Exception as e:
+                    if raise_errors:
+                        raise
+                    logger.error(f"Benchmark failed for {transpiler}: {e}")
+            return results
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(transpilers)) as executor:
+            futures = {
+                executor.submit(self.run_benchmark, transpiler, dataset_path, dataset_stats, options): transpiler
+                for transpiler in transpilers
+            }
+            for future in as_completed(futures):
+                transpiler = futures[future]
+                try:
+                    results[transpiler] = future.result()
+                except Exception as e:
+                    if raise_errors:
+                        raise
+                    logger.error(f"Benchmark failed for {transpiler}: {e}")
+        
+        return [results[t] for t in transpilers if t in results]
+    
+    def run_matrix(self, datasets: List[Tuple[Path, Dict]], transpilers: List[str],
+                   options: Dict = None, raise_errors: bool = False) -> Dict[str, List[Any]]:
+        """Benchmark every transpiler on every (dataset_path, dataset_stats) pair.
+        
+        Results are accumulated column-wise, one list per field, in dataset then
+        transpiler order; `pd.DataFrame(columns)` turns them into a frame.
+        raise_errors is passed on to run_comparative_benchmark.
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in MATRIX_COLUMNS}
+        
+        for dataset_path, dataset_stats in datasets:
+            for result in self.run_comparative_benchmark(dataset_path, dataset_stats,
+                                                         transpilers, options, raise_errors):
+                columns['transpiler'].append(result.transpiler)
+                columns['dataset'].append(result.dataset)
+                columns['success'].append(result.metadata['success'])
+                for name in PERFORMANCE_FIELDS:
+                    columns[name].append(getattr(result.performance, name))
+        
+        return columns
 
 def main():
     """Main CLI interface for benchmark runner."""
@@ -620,91 +1148,113 @@ def main():
     parser.add_argument('--all-transpilers', action='store_true', help="Run all transpilers")
     parser.add_argument('--optimize', action='store_true', help="Enable optimizations")
     parser.add_argument('--minify', action='store_true', help="Enable minification")
+    parser.add_argument('--cpus', help="Comma-separated CPUs to pin benchmarks to, e.g. 2,3")
+    parser.add_argument('--quick', action='store_true',
+                        help="Skip version lookups and memory/CPU sampling")
+    parser.add_argument('--reuse-results', action='store_true',
+                        help="Reuse cached results for unchanged datasets, versions and options")
+    parser.add_argument('--concurrent', action='store_true',
+                        help="Run a dataset's transpilers concurrently (timings include contention)")
     
     args = parser.parse_args()
     
     dataset_manager = DatasetManager()
-    orchestrator = BenchmarkOrchestrator()
+    orchestrator = BenchmarkOrchestrator(reuse_results=args.reuse_results,
+                                         concurrent=args.concurrent)
+    if args.cpus:
+        orchestrator.pin([int(cpu) for cpu in args.cpus.split(',')])
     
-    if args.command == 'validate':
-        # Validate that all containers are working
-        for name, runner in orchestrator.runners.items():
-            try:
-                version = runner.get_version()
-                logger.info(f"{name}: {version}")
-            except Exception as e:
-                logger.error(f"{name}: Failed to get version - {e}")
-        return
-    
-    # Get datasets to test
-    if args.all_datasets:
-        datasets = dataset_manager.list_datasets()
-        if not datasets:
-            logger.error("No datasets available. Create some first.")
+    try:
+        if args.command == 'validate':
+            # Validate that all containers are working
+            for name, runner in orchestrator.runners.items():
+                try:
+                    version = runner.get_version()
+                    logger.info(f"{name}: {version}")
+                except Exception as e:
+                    logger.error(f"{name}: Failed to get version - {e}")
             return
-    elif args.dataset:
-        datasets = [cfg for cfg in dataset_manager.list_datasets() if cfg.name == args.dataset]
-        if not datasets:
-            logger.error(f"Dataset '{args.dataset}' not found")
+    
+        # Get datasets to test
+        if args.all_datasets:
+            datasets = dataset_manager.list_datasets()
+            if not datasets:
+                logger.error("No datasets available. Create some first.")
+                return
+        elif args.dataset:
+            datasets = [cfg for cfg in dataset_manager.list_datasets() if cfg.name == args.dataset]
+            if not datasets:
+                logger.error(f"Dataset '{args.dataset}' not found")
+                return
+        else:
+            logger.error("Must specify --dataset or --all-datasets")
             return
-    else:
-        logger.error("Must specify --dataset or --all-datasets")
-        return
-    
-    # Get transpilers to test
-    if args.all_transpilers:
-        transpilers = list(orchestrator.runners.keys())
-    elif args.transpiler:
-        transpilers = [args.transpiler]
-    else:
-        transpilers = ['ellex', 'swc']  # Default comparison
-    
-    options = {
-        'optimize': args.optimize,
-        'minify': args.minify,
-        'source_maps': True
-    }
     
-    # Run benchmarks
-    all_results = []
+        # Get transpilers to test
+        if args.all_transpilers:
+            transpilers = list(orchestrator.runners.keys())
+        elif args.transpiler:
+            transpilers = [args.transpiler]
+        else:
+            transpilers = ['ellex', 'swc']  # Default comparison
+        orchestrator.start(transpilers)
     
-    for dataset_config in datasets:
-        # Find dataset path
-        dataset_path = None
-        for subdir in ['synthetic', 'real-world', 'npm-packages']:
-            path = Path('./datasets') / subdir / dataset_config.name
-            if path.exists():
-                dataset_path = path
-                break
-        
-        if not dataset_path:
-            logger.error(f"Dataset path not found for {dataset_config.name}")
-            continue
-        
-        dataset_stats = dataset_manager.get_dataset_stats(dataset_config.name)
+        options = {
+            'optimize': args.optimize,
+            'minify': args.minify,
+            'source_maps': True,
+            'quick': args.quick
+        }
+    
+        # Locate every dataset, then run the whole matrix
+        dataset_jobs = []
+    
+        for dataset_config in datasets:
+            # Find dataset path
+            dataset_path = None
+            for subdir in ['synthetic', 'real-world', 'npm-packages']:
+                path = Path('./datasets') / subdir / dataset_config.name
+                if path.exists():
+                    dataset_path = path
+                    break
+        
+            if not dataset_path:
+                logger.error(f"Dataset path not found for {dataset_config.name}")
+                continue
         
-        if args.command == 'run':
-            for transpiler in transpilers:
-                result = orchestrator.run_benchmark(transpiler, dataset_path, dataset_stats, options)
-                all_results.append(result)
-                
-        elif args.command == 'compare':
-            results = orchestrator.run_comparative_benchmark(dataset_path, dataset_stats, transpilers)
-            all_results.extend(results)
-    
-    # Print summary
-    if all_results:
-        print("\n" + "="*80)
-        print("BENCHMARK SUMMARY")
-        print("="*80)
-        print(f"{'Transpiler':<12} {'Dataset':<20} {'Time (ms)':<10} {'Memory (MB)':<12} {'Output (KB)':<12}")
-        print("-"*80)
-        
-        for result in all_results:
-            perf = result.performance
-            print(f"{result.transpiler:<12} {result.dataset:<20} "
-                  f"{perf.compilation_time_ms:<10.1f} {perf.memory_peak_mb:<12.1f} "
-                  f"{perf.output_size_bytes/1024:<12.1f}")
+            dataset_stats = dataset_manager.get_dataset_stats(dataset_config.name)
+            dataset_jobs.append((dataset_path, dataset_stats))
+    
+        # 'compare' skips failing transpilers; 'run' stops at the first failure
+        columns = orchestrator.run_matrix(dataset_jobs, transpilers, options,
+                                          raise_errors=args.command == 'run')
+    
+        # Print summary
+        if columns['transpiler']:
+            print("\n" + "="*80)
+            print("BENCHMARK SUMMARY")
+            print("="*80)
+            print(f"{'Transpiler':<12} {'Dataset':<20} {'Time (ms)':<10} {'Memory (MB)':<12} {'Output (KB)':<12}")
+            print("-"*80)
+        
+            for transpiler, dataset, time_ms, memory_mb, output_bytes in zip(
+                    columns['transpiler'], columns['dataset'], columns['compilation_time_ms'],
+                    columns['memory_peak_mb'], columns['output_size_bytes']):
+                print(f"{transpiler:<12} {dataset:<20} "
+                      f"{time_ms:<10.1f} {memory_mb:<12.1f} "
+                      f"{output_bytes/1024:<12.1f}")
+        
+            # Averages only add information once a transpiler has several runs
+            summary = summarize_matrix(columns)
+            if any(stats['runs'] > 1 for stats in summary.values()):
+                print("-"*80)
+                for transpiler, stats in summary.items():
+                    label = f"(mean of {stats['runs']})"
+                    time_col = f"{stats['mean_time_ms']:.1f}±{stats['std_time_ms']:.1f}"
+                    print(f"{transpiler:<12} {label:<20} "
+                          f"{time_col:<10} {stats['mean_memory_mb']:<12.1f}")
+    finally:
+        orchestrator.close()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
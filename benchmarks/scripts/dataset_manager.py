@@ -5,26 +5,86 @@ Handles creation, cleanup, and management of test codebases.
 """
 
 import os
+import re
 import sys
 import json
 import shutil
 import subprocess
-import tempfile
+import threading
 import urllib.request
 import tarfile
 import zipfile
 import random
 import string
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, asdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Read size used when scanning source files for line counts
+READ_CHUNK_SIZE = 1 << 20
+
+# Source file extensions counted by get_dataset_stats
+SOURCE_SUFFIXES = ('.ts', '.js', '.tsx', '.jsx')
+
+def _walk_sources(root: Path) -> Iterator[Tuple[os.DirEntry, str]]:
+    """Yield (entry, suffix) for every source file under root, in one scandir pass."""
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    suffix = os.path.splitext(entry.name)[1]
+                    if suffix in SOURCE_SUFFIXES:
+                        yield entry, suffix
+        except OSError:
+            continue
+
+def _fast_rmtree(path: Path):
+    """Remove a directory tree, deleting its top-level subdirectories in parallel."""
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # DirEntry carries the type from readdir, so this needs no extra stat
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                os.unlink(entry.path)
+    if subdirs:
+        # Unlinking is syscall-bound and releases the GIL, so subtrees overlap well
+        with ThreadPoolExecutor(max_workers=min(8, len(subdirs))) as executor:
+            list(executor.map(shutil.rmtree, subdirs))
+    os.rmdir(path)
+
+def _count_lines_and_size(file_path: os.PathLike) -> Tuple[int, int]:
+    """Return the line count and byte size of a source file, or zeros if unreadable."""
+    try:
+        with open(file_path, 'rb') as f:
+            # Count newlines over raw chunks; no decoding or per-line objects
+            lines = 0
+            chunk = b''
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b''):
+                lines += chunk.count(b'\n')
+            # An unterminated last line still counts as a line
+            if chunk and not chunk.endswith(b'\n'):
+                lines += 1
+            return lines, os.fstat(f.fileno()).st_size
+    except Exception:
+        return 0, 0
+
+@dataclass(slots=True, frozen=True)
 class DatasetConfig:
     name: str
     description: str
@@ -34,7 +94,7 @@ class DatasetConfig:
     expected_loc: int
     cleanup_after_hours: int = 24
 
-@dataclass  
+@dataclass(slots=True, frozen=True)
 class BenchmarkResult:
     dataset_name: str
     transpiler: str
@@ -44,38 +104,216 @@ class BenchmarkResult:
     error_count: int
     warning_count: int
 
+# Source templates for synthetic modules; every line carries its own newline
+_IMPORTS = """\
+import { EventEmitter } from 'events';
+import * as fs from 'fs';
+import * as path from 'path';
+"""
+
+_PREVIOUS_IMPORT_TMPL = "import {{ Module{previous} }} from './module_{previous:04d}';\n"
+
+_MODULE_HEADER_TMPL = """\
+
+export interface Config{module_id} {{
+  id: number;
+  name: string;
+  enabled: boolean;
+  metadata?: Record<string, any>;
+}}
+
+export class Module{module_id} extends EventEmitter {{
+  private config: Config{module_id};
+  private cache: Map<string, any> = new Map();
+
+  constructor(config: Config{module_id}) {{
+    super();
+    this.config = config;
+  }}
+
+"""
+
+_SIMPLE_METHOD_TMPL = """\
+  public {method_name}(data: string): string {{
+    return data.toUpperCase();
+  }}
+
+"""
+
+_MEDIUM_METHOD_TMPL = """\
+  public async {method_name}(data: any[]): Promise<any[]> {{
+    const results: any[] = [];
+    for (const item of data) {{
+      if (typeof item === 'string') {{
+        results.push(item.toLowerCase());
+      }} else if (typeof item === 'number') {{
+        results.push(item * 2);
+      }} else {{
+        results.push(JSON.stringify(item));
+      }}
+    }}
+    return results;
+  }}
+
+"""
+
+_COMPLEX_METHOD_TMPL = """\
+  public async {method_name}<T>(
+    data: T[],
+    transformer: (item: T) => Promise<T>,
+    filter?: (item: T) => boolean
+  ): Promise<T[]> {{
+    const cacheKey = `${{method_id}}_${{JSON.stringify(data)}}`;
+    if (this.cache.has(cacheKey)) {{
+      return this.cache.get(cacheKey);
+    }}
+
+    let processed = data;
+    if (filter) {{
+      processed = data.filter(filter);
+    }}
+
+    const results = await Promise.all(
+      processed.map(async (item) => {{
+        try {{
+          const result = await transformer(item);
+          this.emit('itemProcessed', {{ item, result }});
+          return result;
+        }} catch (error) {{
+          this.emit('error', error);
+          return item;
+        }}
+      }})
+    );
+
+    this.cache.set(cacheKey, results);
+    return results;
+  }}
+
+"""
+
+_CLASS_FOOTER = "}\n\n"
+
+_UTILITY_TMPL = """\
+function utility{index}(input: unknown): string {{
+  if (input === null || input === undefined) {{
+    return 'null';
+  }}
+  if (typeof input === 'object') {{
+    return JSON.stringify(input, null, 2);
+  }}
+  return String(input);
+}}
+
+"""
+
+# (method template, method count) per complexity level; anything else is complex
+_METHOD_LAYOUTS = {
+    'simple': (_SIMPLE_METHOD_TMPL, 2),
+    'medium': (_MEDIUM_METHOD_TMPL, 4),
+    'complex': (_COMPLEX_METHOD_TMPL, 6),
+}
+
+# Method bodies don't depend on the module, so render each level's block once at import.
+# Prebuilt pieces are kept as bytes so modules are assembled without a text layer.
+_METHOD_BLOCKS = {
+    complexity: ''.join(tmpl.format(method_name=f"process{method_id}") for method_id in range(count)).encode()
+    for complexity, (tmpl, count) in _METHOD_LAYOUTS.items()
+}
+
+# Utility padding only varies by index, so all ten variants are prebuilt
+_UTILITY_FNS = tuple(_UTILITY_TMPL.format(index=i).encode() for i in range(10))
+_UTILITY_FN_LINES = _UTILITY_TMPL.count('\n')
+
+_IMPORTS_BYTES = _IMPORTS.encode()
+_CLASS_FOOTER_BYTES = _CLASS_FOOTER.encode()
+
+# Lines every module has besides its methods and the optional previous-module import
+_FIXED_LINES = _IMPORTS.count('\n') + _MODULE_HEADER_TMPL.count('\n') + _CLASS_FOOTER.count('\n')
+
+def _generate_source_file(file_path: Path, target_lines: int, complexity: str, module_id: int):
+    """Generate a single TypeScript source file."""
+    methods = _METHOD_BLOCKS.get(complexity, _METHOD_BLOCKS['complex'])
+    line_count = _FIXED_LINES + methods.count(b'\n')
+    
+    parts = [_IMPORTS_BYTES]
+    if module_id > 0:
+        parts.append(_PREVIOUS_IMPORT_TMPL.format(previous=module_id - 1).encode())
+        line_count += 1
+    parts.append(_MODULE_HEADER_TMPL.format(module_id=module_id).encode())
+    parts.append(methods)
+    parts.append(_CLASS_FOOTER_BYTES)
+    
+    # Pad with utility functions up to the target line count
+    if line_count < target_lines:
+        utility_count = -(-(target_lines - line_count) // _UTILITY_FN_LINES)
+        parts.append(_UTILITY_FNS[line_count % 10] * utility_count)
+    
+    # Write the file with raw os.write calls, bypassing TextIOWrapper encoding and
+    # newline translation; the final blank line carries no trailing newline
+    view = memoryview(b''.join(parts))[:-1]
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+class LazyDatasetConfigs(dict):
+    """Dataset configs by name, built from their raw JSON entries on first access."""
+    
+    def __getitem__(self, name: str) -> DatasetConfig:
+        value = super().__getitem__(name)
+        if isinstance(value, dict):
+            value = DatasetConfig(**value)
+            super().__setitem__(name, value)
+        return value
+    
+    def get(self, name: str, default=None):
+        return self[name] if name in self else default
+    
+    def values(self) -> List[DatasetConfig]:
+        return [self[name] for name in self]
+    
+    def items(self) -> List[Tuple[str, DatasetConfig]]:
+        return [(name, self[name]) for name in self]
+
 class DatasetManager:
     def __init__(self, datasets_dir: Path = Path('./datasets')):
         self.datasets_dir = datasets_dir
         self.datasets_dir.mkdir(exist_ok=True)
         self.config_file = self.datasets_dir / 'datasets_config.json'
-        self.active_datasets: Dict[str, DatasetConfig] = {}
+        self.stats_cache_file = self.datasets_dir / 'stats_cache.json'
+        self._stats_cache: Optional[Dict] = None
+        self.active_datasets: Dict[str, DatasetConfig] = LazyDatasetConfigs()
+        self._config_lock = threading.Lock()
+        self.repo_cache_dir = self.datasets_dir / '.repo-cache'
+        # Guards _repo_mirror_locks; each mirror has its own lock for git operations
+        self._repo_cache_lock = threading.Lock()
+        self._repo_mirror_locks: Dict[Path, threading.Lock] = {}
         self.load_config()
         
     def load_config(self):
         """Load dataset configuration from JSON file."""
         if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
-                for name, data in config_data.items():
-                    self.active_datasets[name] = DatasetConfig(**data)
+            config_data = self.config_file.read_bytes()
+            config_data = orjson.loads(config_data) if orjson else json.loads(config_data)
+            # Entries stay raw until first accessed; see LazyDatasetConfigs
+            dict.update(self.active_datasets, config_data)
     
     def save_config(self):
         """Save current dataset configuration."""
-        config_data = {
-            name: {
-                'name': cfg.name,
-                'description': cfg.description,
-                'size_category': cfg.size_category,
-                'source_type': cfg.source_type,
-                'parameters': cfg.parameters,
-                'expected_loc': cfg.expected_loc,
-                'cleanup_after_hours': cfg.cleanup_after_hours
-            }
-            for name, cfg in self.active_datasets.items()
-        }
-        with open(self.config_file, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        if orjson:
+            # orjson serializes the dataclasses directly, without an asdict() copy
+            payload = orjson.dumps(self.active_datasets, option=orjson.OPT_INDENT_2)
+        else:
+            config_data = {name: asdict(cfg) for name, cfg in self.active_datasets.items()}
+            payload = json.dumps(config_data, indent=2).encode()
+        
+        # Write to a sibling temp file and swap it in so a crash never leaves a partial config
+        tmp_file = self.config_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, self.config_file)
     
     def create_synthetic_dataset(self, config: DatasetConfig) -> Path:
         """Generate synthetic TypeScript/JavaScript codebase."""
@@ -99,20 +337,9 @@ class DatasetManager:
         src_dir = dataset_path / 'src'
         src_dir.mkdir(exist_ok=True)
         
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = []
-            for i in range(num_files):
-                future = executor.submit(
-                    self._generate_source_file,
-                    src_dir / f'module_{i:04d}.ts',
-                    avg_lines_per_file,
-                    complexity_level,
-                    i
-                )
-                futures.append(future)
-            
-            for future in as_completed(futures):
-                future.result()  # Wait for completion
+        # Each file takes microseconds to build, so a plain loop beats any pool's dispatch cost
+        for i in range(num_files):
+            _generate_source_file(src_dir / f'module_{i:04d}.ts', avg_lines_per_file, complexity_level, i)
         
         # Generate main entry point
         self._generate_main_file(src_dir, num_files)
@@ -125,7 +352,7 @@ class DatasetManager:
         dataset_path = self.datasets_dir / 'real-world' / config.name
         
         if dataset_path.exists():
-            shutil.rmtree(dataset_path)
+            _fast_rmtree(dataset_path)
             
         params = config.parameters
         repo_url = params['repo_url']
@@ -134,29 +361,68 @@ class DatasetManager:
         
         logger.info(f"Cloning {repo_url} (branch: {branch})")
         
-        # Clone repository
-        subprocess.run([
-            'git', 'clone', '--depth', '1', '--branch', branch,
-            repo_url, str(dataset_path)
-        ], check=True, capture_output=True)
-        
-        # If subdir specified, move contents up
-        if subdir:
-            subdir_path = dataset_path / subdir
-            if subdir_path.exists():
-                temp_dir = dataset_path.parent / f"{config.name}_temp"
-                shutil.move(str(subdir_path), str(temp_dir))
-                shutil.rmtree(dataset_path)
-                shutil.move(str(temp_dir), str(dataset_path))
-        
-        # Remove .git directory to save space
-        git_dir = dataset_path / '.git'
-        if git_dir.exists():
-            shutil.rmtree(git_dir)
+        # Check out from a cached blobless mirror; only the blobs under subdir are
+        # fetched, and once fetched they stay in the mirror for later checkouts
+        mirror = self._repo_mirror(repo_url, branch)
+        # A checkout that failed part-way leaves its worktree registered after its
+        # directory is removed, and `worktree add` refuses such a path
+        subprocess.run(['git', '--git-dir', str(mirror), 'worktree', 'prune'],
+                       check=True, capture_output=True)
+        try:
+            subprocess.run([
+                'git', '--git-dir', str(mirror), 'worktree', 'add', '--detach', '--no-checkout',
+                str(dataset_path), branch
+            ], check=True, capture_output=True)
+            if subdir:
+                subprocess.run([
+                    'git', '-C', str(dataset_path), 'sparse-checkout', 'set', subdir
+                ], check=True, capture_output=True)
+            subprocess.run(['git', '-C', str(dataset_path), 'checkout'], check=True, capture_output=True)
+            
+            # If subdir specified, move contents up. Both renames stay on one
+            # filesystem, so each is a single atomic rename rather than a copy.
+            if subdir:
+                subdir_path = dataset_path / subdir
+                if subdir_path.exists():
+                    keep_dir = dataset_path.parent / f"{config.name}.keep"
+                    os.rename(subdir_path, keep_dir)
+                    _fast_rmtree(dataset_path)
+                    os.rename(keep_dir, dataset_path)
+        finally:
+            # Detach the checkout from the mirror, even after a failure; the
+            # worktree's .git is just a link file, and prune drops its entry
+            git_link = dataset_path / '.git'
+            if git_link.is_file():
+                git_link.unlink()
+            subprocess.run(['git', '--git-dir', str(mirror), 'worktree', 'prune'],
+                           capture_output=True)
             
         logger.info(f"Cloned repository to {dataset_path}")
         return dataset_path
     
+    def _repo_mirror(self, repo_url: str, branch: str) -> Path:
+        """Return a shallow, blobless bare mirror of repo_url with branch at its current tip."""
+        slug = re.sub(r'[^\w.-]+', '_', repo_url.split('://')[-1]).strip('_')
+        mirror = self.repo_cache_dir / slug
+        with self._repo_cache_lock:
+            mirror_lock = self._repo_mirror_locks.setdefault(mirror, threading.Lock())
+        
+        # Different repositories clone and fetch concurrently
+        with mirror_lock:
+            if not mirror.exists():
+                logger.info(f"Creating repository mirror {mirror}")
+                subprocess.run([
+                    'git', 'clone', '--bare', '--depth', '1', '--filter=blob:none',
+                    '--branch', branch, repo_url, str(mirror)
+                ], check=True, capture_output=True)
+            else:
+                # Shallow history makes the new tip unrelated to the old one, so force the update
+                subprocess.run([
+                    'git', '--git-dir', str(mirror), 'fetch', '--depth', '1', '--filter=blob:none',
+                    'origin', f'+{branch}:{branch}'
+                ], check=True, capture_output=True)
+        return mirror
+    
     def download_npm_package(self, config: DatasetConfig) -> Path:
         """Download and extract NPM package for testing."""
         dataset_path = self.datasets_dir / 'npm-packages' / config.name
@@ -171,29 +437,36 @@ class DatasetManager:
         # Download package tarball
         npm_url = f"https://registry.npmjs.org/{package_name}/-/{package_name}-{version}.tgz"
         
-        with tempfile.NamedTemporaryFile(suffix='.tgz', delete=False) as tmp_file:
-            urllib.request.urlretrieve(npm_url, tmp_file.name)
-            
-            # Extract tarball
-            with tarfile.open(tmp_file.name, 'r:gz') as tar:
-                tar.extractall(dataset_path)
-        
-        os.unlink(tmp_file.name)
-        
-        # Move package contents up from 'package' subdirectory
-        package_dir = dataset_path / 'package'
-        if package_dir.exists():
-            for item in package_dir.iterdir():
-                shutil.move(str(item), str(dataset_path))
-            package_dir.rmdir()
-            
+        # Extract straight from the response stream; no temp file round-trip.
+        # Members are rewritten in archive order to drop npm's 'package/' prefix,
+        # so the contents land directly in dataset_path without a move pass.
+        try:
+            with urllib.request.urlopen(npm_url) as response, \
+                    tarfile.open(fileobj=response, mode='r|gz') as tar:
+                for member in tar:
+                    if member.name == 'package':
+                        continue
+                    if member.name.startswith('package/'):
+                        member.name = member.name[len('package/'):]
+                    # Hard link targets are archive member names, so they lose the prefix too
+                    if member.islnk() and member.linkname.startswith('package/'):
+                        member.linkname = member.linkname[len('package/'):]
+                    # The 'data' filter rejects members that would land outside dataset_path
+                    tar.extract(member, dataset_path, filter='data')
+        except BaseException:
+            # Don't leave a half-extracted package behind to be picked up as a dataset
+            shutil.rmtree(dataset_path, ignore_errors=True)
+            raise
+        
         logger.info(f"Downloaded npm package to {dataset_path}")
         return dataset_path
     
     def create_dataset(self, config: DatasetConfig) -> Path:
         """Create dataset based on configuration."""
-        self.active_datasets[config.name] = config
-        self.save_config()
+        # Presets may be created concurrently; serialize config updates
+        with self._config_lock:
+            self.active_datasets[config.name] = config
+            self.save_config()
         
         if config.source_type == 'synthetic':
             return self.create_synthetic_dataset(config)
@@ -214,7 +487,7 @@ class DatasetManager:
                 dataset_path = self.datasets_dir / subdir / dataset_name
                 if dataset_path.exists():
                     logger.info(f"Removing dataset {dataset_path}")
-                    shutil.rmtree(dataset_path)
+                    _fast_rmtree(dataset_path)
             
             # Remove from active datasets
             del self.active_datasets[dataset_name]
@@ -256,39 +529,87 @@ class DatasetManager:
             'source_type': config.source_type,
         }
         
-        # Count files and lines
-        ts_files = list(dataset_path.rglob('*.ts'))
-        js_files = list(dataset_path.rglob('*.js'))
-        tsx_files = list(dataset_path.rglob('*.tsx'))
-        jsx_files = list(dataset_path.rglob('*.jsx'))
+        # Count files and lines in a single walk over the tree
+        suffix_counts = dict.fromkeys(SOURCE_SUFFIXES, 0)
+        all_files = []
+        for entry, suffix in _walk_sources(dataset_path):
+            suffix_counts[suffix] += 1
+            all_files.append(entry)
         
-        all_files = ts_files + js_files + tsx_files + jsx_files
+        # Stat-only fingerprint of the tree; a match means no file needs reading
+        cache_key = self._stats_cache_key(all_files)
+        cached = self._load_stats_cache().get(dataset_name)
+        if cached and cached['key'] == cache_key:
+            stats.update(cached['counts'])
+            return stats
         
         total_lines = 0
         total_size = 0
         
-        for file_path in all_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = len(f.readlines())
-                    total_lines += lines
-                    total_size += file_path.stat().st_size
-            except Exception:
-                continue
+        # Reads release the GIL, so threads overlap the per-file I/O latency
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_count_lines_and_size, path) for path in all_files]
+            for future in as_completed(futures):
+                lines, size = future.result()
+                total_lines += lines
+                total_size += size
         
-        stats.update({
+        counts = {
             'total_files': len(all_files),
-            'ts_files': len(ts_files),
-            'js_files': len(js_files),
-            'tsx_files': len(tsx_files),
-            'jsx_files': len(jsx_files),
+            'ts_files': suffix_counts['.ts'],
+            'js_files': suffix_counts['.js'],
+            'tsx_files': suffix_counts['.tsx'],
+            'jsx_files': suffix_counts['.jsx'],
             'total_lines': total_lines,
             'total_size_bytes': total_size,
             'avg_lines_per_file': total_lines / len(all_files) if all_files else 0
-        })
+        }
+        stats.update(counts)
+        
+        self._stats_cache[dataset_name] = {'key': cache_key, 'counts': counts}
+        self._save_stats_cache()
         
         return stats
     
+    def _stats_cache_key(self, files: List[os.DirEntry]) -> List[int]:
+        """Fingerprint a dataset by file count, newest mtime and total size."""
+        latest_mtime_ns = 0
+        total_size = 0
+        for entry in files:
+            try:
+                st = entry.stat()  # cached on the DirEntry from the walk
+            except OSError:
+                continue
+            latest_mtime_ns = max(latest_mtime_ns, st.st_mtime_ns)
+            total_size += st.st_size
+        return [len(files), latest_mtime_ns, total_size]
+    
+    def _load_stats_cache(self) -> Dict:
+        """Load cached dataset stats, reading the cache file at most once."""
+        if self._stats_cache is None:
+            self._stats_cache = {}
+            if self.stats_cache_file.exists():
+                try:
+                    # Parse the whole buffer at once instead of through a text wrapper
+                    data = self.stats_cache_file.read_bytes()
+                    self._stats_cache = orjson.loads(data) if orjson else json.loads(data)
+                except (OSError, ValueError):
+                    logger.warning(f"Ignoring unreadable stats cache {self.stats_cache_file}")
+        return self._stats_cache
+    
+    def _save_stats_cache(self):
+        """Persist cached dataset stats."""
+        if orjson:
+            payload = orjson.dumps(self._stats_cache, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self._stats_cache, indent=2).encode()
+        
+        # Swap in a complete file, as save_config does
+        tmp_file = self.stats_cache_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, self.stats_cache_file)
+    
     def _generate_package_json(self, dataset_path: Path, name: str):
         """Generate a package.json file."""
         package_json = {
@@ -337,140 +658,6 @@ class DatasetManager:
         with open(dataset_path / 'tsconfig.json', 'w') as f:
             json.dump(tsconfig, f, indent=2)
     
-    def _generate_source_file(self, file_path: Path, target_lines: int, complexity: str, module_id: int):
-        """Generate a single TypeScript source file."""
-        lines = []
-        
-        # Imports
-        lines.append("import { EventEmitter } from 'events';")
-        lines.append("import * as fs from 'fs';")
-        lines.append("import * as path from 'path';")
-        if module_id > 0:
-            lines.append(f"import {{ Module{module_id - 1} }} from './module_{module_id - 1:04d}';")
-        lines.append("")
-        
-        # Interface definitions
-        lines.append(f"export interface Config{module_id} {{")
-        lines.append("  id: number;")
-        lines.append("  name: string;")
-        lines.append("  enabled: boolean;")
-        lines.append("  metadata?: Record<string, any>;")
-        lines.append("}")
-        lines.append("")
-        
-        # Class definition
-        class_name = f"Module{module_id}"
-        lines.append(f"export class {class_name} extends EventEmitter {{")
-        lines.append(f"  private config: Config{module_id};")
-        lines.append("  private cache: Map<string, any> = new Map();")
-        lines.append("")
-        
-        # Constructor
-        lines.append(f"  constructor(config: Config{module_id}) {{")
-        lines.append("    super();")
-        lines.append("    this.config = config;")
-        lines.append("  }")
-        lines.append("")
-        
-        # Methods based on complexity
-        if complexity == 'simple':
-            methods_count = 2
-        elif complexity == 'medium':
-            methods_count = 4
-        else:  # complex
-            methods_count = 6
-        
-        for method_id in range(methods_count):
-            lines.extend(self._generate_method(method_id, complexity))
-            lines.append("")
-        
-        lines.append("}")
-        lines.append("")
-        
-        # Add more content to reach target lines
-        while len(lines) < target_lines:
-            lines.extend(self._generate_utility_function(len(lines)))
-            lines.append("")
-        
-        # Write file
-        with open(file_path, 'w') as f:
-            f.write('\n'.join(lines))
-    
-    def _generate_method(self, method_id: int, complexity: str) -> List[str]:
-        """Generate a method with specified complexity."""
-        lines = []
-        method_name = f"process{method_id}"
-        
-        if complexity == 'simple':
-            lines.append(f"  public {method_name}(data: string): string {{")
-            lines.append("    return data.toUpperCase();")
-            lines.append("  }")
-        elif complexity == 'medium':
-            lines.append(f"  public async {method_name}(data: any[]): Promise<any[]> {{")
-            lines.append("    const results: any[] = [];")
-            lines.append("    for (const item of data) {")
-            lines.append("      if (typeof item === 'string') {")
-            lines.append("        results.push(item.toLowerCase());")
-            lines.append("      } else if (typeof item === 'number') {")
-            lines.append("        results.push(item * 2);")
-            lines.append("      } else {")
-            lines.append("        results.push(JSON.stringify(item));")
-            lines.append("      }")
-            lines.append("    }")
-            lines.append("    return results;")
-            lines.append("  }")
-        else:  # complex
-            lines.append(f"  public async {method_name}<T>(")
-            lines.append("    data: T[],")
-            lines.append("    transformer: (item: T) => Promise<T>,")
-            lines.append("    filter?: (item: T) => boolean")
-            lines.append("  ): Promise<T[]> {")
-            lines.append("    const cacheKey = `${method_id}_${JSON.stringify(data)}`;")
-            lines.append("    if (this.cache.has(cacheKey)) {")
-            lines.append("      return this.cache.get(cacheKey);")
-            lines.append("    }")
-            lines.append("")
-            lines.append("    let processed = data;")
-            lines.append("    if (filter) {")
-            lines.append("      processed = data.filter(filter);")
-            lines.append("    }")
-            lines.append("")
-            lines.append("    const results = await Promise.all(")
-            lines.append("      processed.map(async (item) => {")
-            lines.append("        try {")
-            lines.append("          const result = await transformer(item);")
-            lines.append("          this.emit('itemProcessed', { item, result });")
-            lines.append("          return result;")
-            lines.append("        } catch (error) {")
-            lines.append("          this.emit('error', error);")
-            lines.append("          return item;")
-            lines.append("        }")
-            lines.append("      })")
-            lines.append("    );")
-            lines.append("")
-            lines.append("    this.cache.set(cacheKey, results);")
-            lines.append("    return results;")
-            lines.append("  }")
-        
-        return lines
-    
-    def _generate_utility_function(self, seed: int) -> List[str]:
-        """Generate a utility function to add more lines."""
-        lines = []
-        func_name = f"utility{seed % 10}"
-        
-        lines.append(f"function {func_name}(input: unknown): string {{")
-        lines.append("  if (input === null || input === undefined) {")
-        lines.append("    return 'null';")
-        lines.append("  }")
-        lines.append("  if (typeof input === 'object') {")
-        lines.append("    return JSON.stringify(input, null, 2);")
-        lines.append("  }")
-        lines.append("  return String(input);")
-        lines.append("}")
-        
-        return lines
-    
     def _generate_main_file(self, src_dir: Path, num_modules: int):
         """Generate main entry point that imports all modules."""
         lines = []
@@ -578,6 +765,8 @@ STANDARD_DATASETS = [
     )
 ]
 
+STANDARD_DATASETS_BY_NAME = {cfg.name: cfg for cfg in STANDARD_DATASETS}
+
 def main():
     """Main CLI interface for dataset management."""
     import argparse
@@ -585,7 +774,7 @@ def main():
     parser = argparse.ArgumentParser(description="Transpiler benchmark dataset manager")
     parser.add_argument('command', choices=['create', 'list', 'stats', 'cleanup', 'cleanup-all'])
     parser.add_argument('--dataset', help="Dataset name")
-    parser.add_argument('--preset', choices=[cfg.name for cfg in STANDARD_DATASETS], 
+    parser.add_argument('--preset', choices=STANDARD_DATASETS_BY_NAME, 
                        help="Use a predefined dataset configuration")
     parser.add_argument('--all-presets', action='store_true',
                        help="Create all predefined datasets")
@@ -596,14 +785,19 @@ def main():
     
     if args.command == 'create':
         if args.all_presets:
-            for config in STANDARD_DATASETS:
-                try:
-                    path = manager.create_dataset(config)
-                    logger.info(f"Created dataset '{config.name}' at {path}")
-                except Exception as e:
-                    logger.error(f"Failed to create dataset '{config.name}': {e}")
+            # Presets are independent network/disk jobs, so overlap them
+            with ThreadPoolExecutor(max_workers=len(STANDARD_DATASETS)) as executor:
+                futures = {executor.submit(manager.create_dataset, config): config
+                           for config in STANDARD_DATASETS}
+                for future in as_completed(futures):
+                    config = futures[future]
+                    try:
+                        path = future.result()
+                        logger.info(f"Created dataset '{config.name}' at {path}")
+                    except Exception as e:
+                        logger.error(f"Failed to create dataset '{config.name}': {e}")
         elif args.preset:
-            config = next(cfg for cfg in STANDARD_DATASETS if cfg.name == args.preset)
+            config = STANDARD_DATASETS_BY_NAME[args.preset]
             path = manager.create_dataset(config)
             logger.info(f"Created dataset '{config.name}' at {path}")
         else:
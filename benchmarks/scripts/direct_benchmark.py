@@ -5,19 +5,26 @@ Tests Ellex transpiler against reference implementations.
 """
 
 import os
+import atexit
 import sys
 import json
+import hashlib
 import time
+import signal
 import subprocess
 import tempfile
 import psutil
 import shutil
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from concurrent.futures import ThreadPoolExecutor
 import statistics
 import logging
 
+from benchmark_runner import count_diagnostics, scratch_root
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -34,22 +41,139 @@ class BenchmarkResult:
     warning_count: int
     timestamp: float
 
+# BenchmarkResult is flat, so a shallow field copy replaces asdict()'s recursive one
+RESULT_FIELDS = tuple(f.name for f in fields(BenchmarkResult))
+
+def result_to_dict(result: BenchmarkResult) -> Dict:
+    """Return a BenchmarkResult's fields as a plain dict."""
+    return {name: getattr(result, name) for name in RESULT_FIELDS}
+
+# Bump when the shape or meaning of cached transpile outcomes changes
+TRANSPILE_CACHE_VERSION = 3
+
+# Fixed lines wrapped around every converted file
+ELLEX_PREAMBLE = b'tell "Benchmark test file"\n'
+ELLEX_FOOTER = (
+    b'make countdown:\n'
+    b'  tell "Starting countdown..."\n'
+    b'  repeat 3 times:\n'
+    b'    tell "Tick"\n'
+    b'  tell "Done!"\n'
+    b'\n'
+    b'countdown\n'
+    b'tell "Benchmark complete"'
+)
+
+# Comment line placed between files in a batched Ellex run
+ELLEX_BATCH_SEPARATOR = b'\n# ===SEP===\n'
+
+def first_ts_files(root: Path, n: int) -> List[Path]:
+    """Return up to n .ts files under root, stopping the walk once n are found."""
+    found = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith('.ts'):
+                found.append(Path(dirpath) / filename)
+                if len(found) == n:
+                    return found
+    return found
+
+# Multiplier converting byte counts to MB
+BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+class ChildSampler(threading.Thread):
+    """Background thread that samples a child process's RSS to find its peak."""
+    
+    def __init__(self, pid: int, interval: float = 0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak_rss = 0
+        self._done = threading.Event()
+        try:
+            self._proc = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            self._proc = None
+    
+    def run(self):
+        if self._proc is None:
+            return
+        # A single memory_info() read per sample; oneshot() only pays off for several
+        memory_info = self._proc.memory_info
+        while not self._done.is_set():
+            try:
+                rss = memory_info().rss
+                if rss > self.peak_rss:
+                    self.peak_rss = rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                break  # the child already exited
+            self._done.wait(self.interval)
+    
+    def stop(self) -> float:
+        """Stop sampling and return the peak RSS in MB."""
+        self._done.set()
+        self.join()
+        return self.peak_rss * BYTES_TO_MB
+
+def run_sampled(cmd: List[str], timeout: float, text: bool = True) -> Tuple[subprocess.CompletedProcess, float]:
+    """Run cmd to completion while sampling its memory; returns (result, peak RSS in MB)."""
+    # Run in its own session so a timeout can kill any grandchildren along with it
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=text,
+                          start_new_session=True) as proc:
+        sampler = ChildSampler(proc.pid)
+        sampler.start()
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass  # the group already exited
+            proc.communicate()
+            raise
+        finally:
+            peak_mb = sampler.stop()
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr), peak_mb
+
 class DirectBenchmarkRunner:
-    def __init__(self, results_dir: Path = Path('./results')):
+    def __init__(self, results_dir: Path = Path('./results'), reuse_transpiles: bool = False,
+                 batch_transpiles: bool = False):
         self.results_dir = results_dir
         self.results_dir.mkdir(exist_ok=True)
         self.project_root = Path(__file__).parent.parent.parent
+        # Opt-in cache of per-file outcomes; cached files add no time to the run
+        self.reuse_transpiles = reuse_transpiles
+        self._transpile_cache: Dict[str, list] = {}
+        # Kept beside results/ rather than in it, where analysis tools read every *.json
+        self._transpile_cache_path = self.results_dir.parent / '.cache' / 'transpile_cache.json'
+        self._ellex_stamp = b''
+        # Resolved once; PATH does not change during a run
+        self._tsc_path = shutil.which('tsc')
+        # Opt-in single ellex_cli run per dataset instead of one per file
+        self.batch_transpiles = batch_transpiles
+        if reuse_transpiles:
+            self._load_transpile_cache()
+            atexit.register(self._save_transpile_cache)
+        # Shared for the runner's lifetime; subprocess waits release the GIL
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._ellex_built = False
+        # Keep converted sources and compiler output off disk-backed /tmp to cut I/O noise
+        self._tmp_root = tempfile.mkdtemp(prefix='ellex-bench-', dir=scratch_root())
+        atexit.register(shutil.rmtree, self._tmp_root, ignore_errors=True)
+    
+    def close(self):
+        """Shut down the transpile worker pool."""
+        self._pool.shutdown()
         
     def benchmark_ellex(self, dataset_path: Path, dataset_stats: Dict) -> BenchmarkResult:
         """Benchmark Ellex transpiler directly."""
         logger.info(f"Benchmarking Ellex on dataset: {dataset_path.name}")
         
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=self._tmp_root) as temp_dir:
             output_dir = Path(temp_dir) / 'ellex_output'
             output_dir.mkdir()
             
             # Find TypeScript files to transpile
-            ts_files = list(dataset_path.rglob('*.ts'))[:5]  # Limit for testing
+            ts_files = first_ts_files(dataset_path, 5)  # Limit for testing
             
             if not ts_files:
                 return BenchmarkResult(
@@ -65,61 +189,32 @@ class DirectBenchmarkRunner:
                     timestamp=time.time()
                 )
             
-            # Monitor memory usage
-            process = psutil.Process()
-            memory_samples = []
+            # Build Ellex first if not built
+            self._ensure_ellex_built()
             
             start_time = time.perf_counter()
             success_count = 0
             total_output_size = 0
-            all_stderr = []
+            error_count = 0
+            warning_count = 0
+            memory_samples = []
             
-            for ts_file in ts_files:
-                try:
-                    # Read TypeScript content
-                    with open(ts_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        ts_content = f.read()
-                    
-                    # Simple TS to Ellex conversion
-                    ellex_content = self._convert_ts_to_ellex(ts_content)
-                    
-                    # Create temporary ellex file
-                    ellex_file = output_dir / f"{ts_file.stem}.ellex"
-                    with open(ellex_file, 'w') as f:
-                        f.write(ellex_content)
-                    
-                    # Try to transpile with Ellex CLI
-                    js_output = output_dir / f"{ts_file.stem}.js"
-                    
-                    # Build Ellex first if not built
-                    self._ensure_ellex_built()
-                    
-                    # Use ellex run command to execute the file
-                    cmd = [
-                        str(self.project_root / 'crates' / 'target' / 'release' / 'ellex_cli'),
-                        'run',
-                        str(ellex_file)
-                    ]
-                    
-                    # Measure memory during compilation
-                    mem_before = process.memory_info().rss / 1024 / 1024
-                    
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                    
-                    mem_after = process.memory_info().rss / 1024 / 1024
-                    memory_samples.extend([mem_before, mem_after])
-                    
-                    if result.returncode == 0:
-                        success_count += 1
-                        # For Ellex, we measure the execution success rather than JS output
-                        total_output_size += len(result.stdout.encode('utf-8'))
-                    else:
-                        all_stderr.append(result.stderr)
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to process {ts_file}: {e}")
-                    all_stderr.append(str(e))
-                    continue
+            outcomes = None
+            if self.batch_transpiles:
+                outcomes = self._transpile_batch(ts_files, output_dir)
+                if outcomes is None:
+                    # Time only the per-file runs, not the abandoned batch attempt
+                    logger.warning("Batched Ellex run abandoned, running files individually")
+                    start_time = time.perf_counter()
+            if outcomes is None:
+                outcomes = self._transpile_each(ts_files, output_dir)
+            for success, output_size, errors, warnings, peak_mb in outcomes:
+                memory_samples.append(peak_mb)
+                error_count += errors
+                warning_count += warnings
+                if success:
+                    success_count += 1
+                    total_output_size += output_size
             
             end_time = time.perf_counter()
             compilation_time_ms = (end_time - start_time) * 1000
@@ -129,11 +224,6 @@ class DirectBenchmarkRunner:
             total_lines = dataset_stats.get('total_lines', 1)
             lines_per_second = total_lines / (compilation_time_ms / 1000) if compilation_time_ms > 0 else 0
             
-            # Count errors
-            stderr_text = ' '.join(all_stderr).lower()
-            error_count = stderr_text.count('error')
-            warning_count = stderr_text.count('warning')
-            
             return BenchmarkResult(
                 transpiler="ellex",
                 dataset=dataset_path.name,
@@ -147,12 +237,105 @@ class DirectBenchmarkRunner:
                 timestamp=time.time()
             )
     
+    def _transpile_each(self, ts_files: List[Path], output_dir: Path) -> List[Tuple[bool, int, int, int, float]]:
+        """Transpile and run each file in its own ellex_cli process."""
+        # Each file is an independent subprocess, so run them all concurrently
+        return list(self._pool.map(lambda item: self._transpile_one(*item, output_dir), enumerate(ts_files)))
+    
+    def _transpile_batch(self, ts_files: List[Path], output_dir: Path) -> Optional[List[Tuple[bool, int, int, int, float]]]:
+        """Convert all files into one combined Ellex program and run it once.
+        
+        ellex_cli runs a single file per invocation, so this saves a process start
+        per file. Returns None if the combined program fails or times out, so the
+        caller can re-run the files individually and attribute errors to the
+        right file.
+        """
+        try:
+            combined = ELLEX_BATCH_SEPARATOR.join(
+                self._convert_ts_to_ellex(ts_file.read_bytes().decode('utf-8', errors='ignore'))
+                for ts_file in ts_files
+            )
+            combined_file = output_dir / 'combined.ellex'
+            combined_file.write_bytes(combined)
+            
+            cmd = [
+                str(self.project_root / 'crates' / 'target' / 'release' / 'ellex_cli'),
+                'run',
+                str(combined_file)
+            ]
+            result, peak_mb = run_sampled(cmd, timeout=30 * len(ts_files), text=False)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Batched Ellex run failed: {e}")
+            return None
+        
+        if result.returncode != 0:
+            logger.info(f"Batched Ellex run exited with status {result.returncode}")
+            return None
+        
+        # The batch's stdout is counted once, against the first file
+        return [(True, len(result.stdout) if i == 0 else 0, 0, 0, peak_mb) for i in range(len(ts_files))]
+    
+    def _transpile_one(self, index: int, ts_file: Path, output_dir: Path) -> Tuple[bool, int, int, int, float]:
+        """Convert one TypeScript file to Ellex and run it.
+        
+        ``index`` prefixes the converted file name so files that share a stem
+        (src/index.ts, lib/index.ts) don't overwrite each other mid-run.
+        
+        Returns (success, output size, error count, warning count, peak child RSS in MB).
+        """
+        try:
+            ts_bytes = ts_file.read_bytes()
+            
+            # Identical input on the same ellex_cli build gives the same outcome
+            cache_key = None
+            if self.reuse_transpiles:
+                cache_key = hashlib.blake2b(self._ellex_stamp + ts_bytes, digest_size=16).hexdigest()
+                cached = self._transpile_cache.get(cache_key)
+                if cached is not None:
+                    return tuple(cached)
+            
+            # Decode in one bulk pass; the converter strips each line, so CRLF
+            # needs no newline translation
+            ts_content = ts_bytes.decode('utf-8', errors='ignore')
+            
+            # Simple TS to Ellex conversion
+            ellex_content = self._convert_ts_to_ellex(ts_content)
+            
+            # Create temporary ellex file
+            ellex_file = output_dir / f"{index}_{ts_file.stem}.ellex"
+            ellex_file.write_bytes(ellex_content)
+            
+            # Use ellex run command to execute the file
+            cmd = [
+                str(self.project_root / 'crates' / 'target' / 'release' / 'ellex_cli'),
+                'run',
+                str(ellex_file)
+            ]
+            
+            # Keep the output as bytes: only its size is needed on success
+            result, peak_mb = run_sampled(cmd, timeout=30, text=False)
+            
+            if result.returncode == 0:
+                # For Ellex, we measure the execution success rather than JS output
+                outcome = (True, len(result.stdout), 0, 0, peak_mb)
+            else:
+                diagnostics = count_diagnostics(result.stderr)
+                outcome = (False, 0, diagnostics[b'error'], diagnostics[b'warning'], peak_mb)
+            if cache_key is not None:
+                self._transpile_cache[cache_key] = outcome
+            return outcome
+                
+        except Exception as e:
+            logger.warning(f"Failed to process {ts_file}: {e}")
+            diagnostics = count_diagnostics(str(e).encode())
+            return False, 0, diagnostics[b'error'], diagnostics[b'warning'], 0
+    
     def benchmark_tsc(self, dataset_path: Path, dataset_stats: Dict) -> BenchmarkResult:
         """Benchmark TypeScript compiler."""
         logger.info(f"Benchmarking TSC on dataset: {dataset_path.name}")
         
         # Check if tsc is available
-        if not shutil.which('tsc'):
+        if not self._tsc_path:
             logger.warning("TypeScript compiler not found, skipping TSC benchmark")
             return BenchmarkResult(
                 transpiler="tsc",
@@ -167,24 +350,30 @@ class DirectBenchmarkRunner:
                 timestamp=time.time()
             )
         
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=self._tmp_root) as temp_dir:
             output_dir = Path(temp_dir) / 'tsc_output'
             output_dir.mkdir()
             
-            # Copy dataset to temp directory
-            source_dir = Path(temp_dir) / 'src'
-            shutil.copytree(dataset_path, source_dir)
-            
-            # Monitor memory
-            process = psutil.Process()
-            mem_before = process.memory_info().rss / 1024 / 1024
+            # Compile the dataset in place; tsc only writes to --outDir, so no copy is needed.
+            # Datasets without a tsconfig.json get a minimal one in the temp directory.
+            # tsc resolves its paths relative to the tsconfig, so those are absolute.
+            project_dir = dataset_path
+            if not (dataset_path / 'tsconfig.json').exists():
+                project_dir = Path(temp_dir)
+                source_root = dataset_path.resolve()
+                with open(project_dir / 'tsconfig.json', 'w') as f:
+                    json.dump({
+                        'compilerOptions': {'rootDir': str(source_root)},
+                        'include': [str(source_root / '**' / '*')],
+                        'exclude': [str(source_root / 'node_modules')]
+                    }, f, indent=2)
             
             start_time = time.perf_counter()
             
             # Run TypeScript compiler with lenient settings
             cmd = [
-                'tsc',
-                '--project', str(source_dir),
+                self._tsc_path,
+                '--project', str(project_dir),
                 '--outDir', str(output_dir),
                 '--target', 'es2020',
                 '--module', 'commonjs',
@@ -194,8 +383,7 @@ class DirectBenchmarkRunner:
             ]
             
             try:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-                mem_after = process.memory_info().rss / 1024 / 1024
+                result, memory_peak_mb = run_sampled(cmd, timeout=120, text=False)
                 
                 end_time = time.perf_counter()
                 compilation_time_ms = (end_time - start_time) * 1000
@@ -207,14 +395,12 @@ class DirectBenchmarkRunner:
                         total_output_size += js_file.stat().st_size
                 
                 # Calculate metrics
-                memory_peak_mb = max(mem_before, mem_after)
                 total_lines = dataset_stats.get('total_lines', 1)
                 lines_per_second = total_lines / (compilation_time_ms / 1000) if compilation_time_ms > 0 else 0
                 
                 # Count errors and warnings
-                stderr_text = result.stderr.lower()
-                error_count = stderr_text.count('error')
-                warning_count = stderr_text.count('warning')
+                diagnostics = count_diagnostics(result.stderr)
+                error_count, warning_count = diagnostics[b'error'], diagnostics[b'warning']
                 
                 return BenchmarkResult(
                     transpiler="tsc",
@@ -244,7 +430,10 @@ class DirectBenchmarkRunner:
                 )
     
     def _ensure_ellex_built(self):
-        """Ensure Ellex is built."""
+        """Ensure Ellex is built, checking at most once per runner."""
+        if self._ellex_built:
+            return
+        
         ellex_binary = self.project_root / 'crates' / 'target' / 'release' / 'ellex_cli'
         
         if not ellex_binary.exists():
@@ -255,51 +444,48 @@ class DirectBenchmarkRunner:
             if result.returncode != 0:
                 logger.error(f"Failed to build Ellex: {result.stderr}")
                 raise RuntimeError("Ellex build failed")
+        # Transpile cache entries are only valid for this exact binary
+        st = ellex_binary.stat()
+        self._ellex_stamp = f"{TRANSPILE_CACHE_VERSION}:{st.st_mtime_ns}:{st.st_size}:".encode()
+        self._ellex_built = True
+    
+    def _load_transpile_cache(self):
+        """Load cached per-file transpile outcomes."""
+        if self._transpile_cache_path.exists():
+            try:
+                with open(self._transpile_cache_path, 'r') as f:
+                    self._transpile_cache = json.load(f)
+            except (OSError, ValueError):
+                logger.warning(f"Ignoring unreadable transpile cache {self._transpile_cache_path}")
+    
+    def _save_transpile_cache(self):
+        """Persist cached per-file transpile outcomes."""
+        self._transpile_cache_path.parent.mkdir(exist_ok=True)
+        # Write to a sibling temp file and swap it in so an interrupted save never leaves a partial cache
+        tmp_file = self._transpile_cache_path.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(self._transpile_cache, f)
+        os.replace(tmp_file, self._transpile_cache_path)
     
-    def _convert_ts_to_ellex(self, ts_content: str) -> str:
-        """Convert TypeScript to Ellex for testing."""
-        lines = ts_content.split('\n')
+    def _convert_ts_to_ellex(self, ts_content: str) -> bytes:
+        """Convert TypeScript to Ellex for testing, returning UTF-8 bytes."""
         ellex_lines = []
+        append = ellex_lines.append
         
-        for line in lines:
-            stripped = line.strip()
-            
+        for stripped in map(str.strip, ts_content.split('\n')):
             # Convert console.log() to tell
             if 'console.log(' in stripped:
                 start = stripped.find('console.log(') + 12
                 end = stripped.rfind(')')
                 if end > start:
-                    content = stripped[start:end]
-                    ellex_lines.append(f'tell {content}')
-                continue
+                    append(f'tell {stripped[start:end]}\n')
             
-            # Convert simple variable declarations
-            if stripped.startswith('const ') or stripped.startswith('let '):
-                ellex_lines.append(f'# {stripped}')
-                continue
-            
-            # Skip empty lines and comments
-            if not stripped or stripped.startswith('//') or stripped.startswith('/*'):
-                continue
-                
-            # Default: comment out complex TypeScript
-            if stripped:
-                ellex_lines.append(f'# {stripped}')
+            # Skip empty lines and comments; comment out declarations and
+            # any other complex TypeScript
+            elif stripped and not stripped.startswith(('//', '/*')):
+                append(f'# {stripped}\n')
         
-        # Add basic Ellex content
-        ellex_lines.insert(0, 'tell "Benchmark test file"')
-        ellex_lines.extend([
-            'make countdown:',
-            '  tell "Starting countdown..."',
-            '  repeat 3 times:',
-            '    tell "Tick"',
-            '  tell "Done!"',
-            '',
-            'countdown',
-            'tell "Benchmark complete"'
-        ])
-        
-        return '\n'.join(ellex_lines)
+        return ELLEX_PREAMBLE + ''.join(ellex_lines).encode('utf-8') + ELLEX_FOOTER
     
     def run_comparative_benchmark(self, dataset_path: Path, dataset_stats: Dict) -> List[BenchmarkResult]:
         """Run benchmarks for multiple transpilers."""
@@ -319,20 +505,28 @@ class DirectBenchmarkRunner:
         except Exception as e:
             logger.error(f"TSC benchmark failed: {e}")
         
-        # Save results
-        for result in results:
-            result_file = self.results_dir / f"{result.transpiler}_{result.dataset}_{int(result.timestamp)}.json"
-            with open(result_file, 'w') as f:
-                json.dump(asdict(result), f, indent=2)
+        # Append results to the log, one JSON object per line
+        with open(self.results_dir / 'results.jsonl', 'a') as f:
+            for result in results:
+                f.write(json.dumps(result_to_dict(result)) + '\n')
         
         return results
 
 def main():
     """Run direct benchmarks."""
+    import argparse
     from dataset_manager import DatasetManager
     
+    parser = argparse.ArgumentParser(description="Direct transpiler benchmarks (no Docker)")
+    parser.add_argument('--reuse-transpiles', action='store_true',
+                        help="Reuse cached Ellex outcomes for unchanged files and ellex_cli builds")
+    parser.add_argument('--batch-transpiles', action='store_true',
+                        help="Run all Ellex files of a dataset in one ellex_cli process")
+    args = parser.parse_args()
+    
     dataset_manager = DatasetManager()
-    runner = DirectBenchmarkRunner()
+    runner = DirectBenchmarkRunner(reuse_transpiles=args.reuse_transpiles,
+                                   batch_transpiles=args.batch_transpiles)
     
     # Get datasets
     datasets = [cfg for cfg in dataset_manager.list_datasets() if cfg.name in ['small_synthetic', 'medium_synthetic']]
@@ -343,18 +537,21 @@ def main():
     
     all_results = []
     
-    for dataset_config in datasets:
-        # Find dataset path
-        dataset_path = Path('./datasets/synthetic') / dataset_config.name
-        if not dataset_path.exists():
-            logger.error(f"Dataset path not found: {dataset_path}")
-            continue
+    try:
+        for dataset_config in datasets:
+            # Find dataset path
+            dataset_path = Path('./datasets/synthetic') / dataset_config.name
+            if not dataset_path.exists():
+                logger.error(f"Dataset path not found: {dataset_path}")
+                continue
         
-        dataset_stats = dataset_manager.get_dataset_stats(dataset_config.name)
+            dataset_stats = dataset_manager.get_dataset_stats(dataset_config.name)
         
-        logger.info(f"Running benchmarks on {dataset_config.name}")
-        results = runner.run_comparative_benchmark(dataset_path, dataset_stats)
-        all_results.extend(results)
+            logger.info(f"Running benchmarks on {dataset_config.name}")
+            results = runner.run_comparative_benchmark(dataset_path, dataset_stats)
+            all_results.extend(results)
+    finally:
+        runner.close()
     
     # Print results
     if all_results:
@@ -4,40 +4,80 @@ Simple analysis script for direct benchmark results.
 """
 
 import json
-import glob
 from pathlib import Path
-import statistics
+from collections import defaultdict
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+def json_loads(data: bytes):
+    """Parse a JSON document from bytes."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj, indent: bool = True) -> bytes:
+    """Serialize obj as JSON bytes, indented unless indent is False."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+# Append-only log written by direct_benchmark.py, one result per line
+RESULTS_LOG = 'results.jsonl'
+
+# Fields that identify a direct benchmark result in a legacy per-file JSON
+_RESULT_KEYS = ('transpiler', 'dataset', 'success', 'compilation_time_ms')
+
+def load_legacy_results(results_dir: Path) -> list:
+    """Load per-result JSON files written before the results log existed.
+    
+    The files are only read, never moved, so they are picked up on every run.
+    Files that are not direct benchmark results (caches, other tools) are skipped.
+    """
+    results = []
+    for file_path in results_dir.glob('*.json'):
+        try:
+            result = json_loads(file_path.read_bytes())
+        except Exception as e:
+            print(f"Failed to load {file_path}: {e}")
+            continue
+        if isinstance(result, dict) and all(key in result for key in _RESULT_KEYS):
+            results.append(result)
+    return results
 
 def analyze_results():
     """Analyze benchmark results and create summary."""
     results_dir = Path('./results')
-    result_files = list(results_dir.glob('*.json'))
+    results_log = results_dir / RESULTS_LOG
+    results = load_legacy_results(results_dir) if results_dir.is_dir() else []
     
-    if not result_files:
+    if not results and not results_log.exists():
         print("No results found")
         return
     
-    results = []
-    for file_path in result_files:
+    # One sequential read of the log instead of an open() per result
+    log_lines = results_log.read_bytes().splitlines() if results_log.exists() else []
+    for line_no, line in enumerate(log_lines, 1):
+        if not line.strip():
+            continue
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                results.append(data)
+            results.append(json_loads(line))
         except Exception as e:
-            print(f"Failed to load {file_path}: {e}")
+            print(f"Failed to load {results_log}:{line_no}: {e}")
             continue
     
     if not results:
         print("No valid results found")
         return
     
-    # Group by transpiler
-    transpilers = {}
+    # Group by transpiler and by dataset/transpiler in a single pass
+    transpilers = defaultdict(list)
+    datasets = defaultdict(lambda: defaultdict(list))
     for result in results:
         transpiler = result['transpiler']
-        if transpiler not in transpilers:
-            transpilers[transpiler] = []
         transpilers[transpiler].append(result)
+        datasets[result['dataset']][transpiler].append(result)
     
     print("="*80)
     print("TRANSPILER BENCHMARK ANALYSIS")
@@ -52,14 +92,14 @@ def analyze_results():
             print(f"\n{transpiler.upper()}: No successful runs")
             continue
         
-        times = [r['compilation_time_ms'] for r in successful_results]
-        memories = [r['memory_peak_mb'] for r in successful_results]
-        throughputs = [r['lines_per_second'] for r in successful_results]
+        # One (runs, 3) array of time, memory and throughput; column-wise stats in one pass
+        metrics = np.array([
+            [r['compilation_time_ms'], r['memory_peak_mb'], r['lines_per_second']]
+            for r in successful_results
+        ], dtype=np.float64)
         
-        avg_time = statistics.mean(times)
-        std_time = statistics.stdev(times) if len(times) > 1 else 0
-        avg_memory = statistics.mean(memories)
-        avg_throughput = statistics.mean(throughputs)
+        avg_time, avg_memory, avg_throughput = metrics.mean(axis=0).tolist()
+        std_time = float(metrics[:, 0].std(ddof=1)) if len(metrics) > 1 else 0
         success_rate = len(successful_results) / len(results_list)
         
         summary_stats[transpiler] = {
@@ -85,46 +125,38 @@ def analyze_results():
         print("COMPARATIVE ANALYSIS")
         print("="*80)
         
-        transpiler_names = list(summary_stats.keys())
+        transpiler_names = [t for t, stats in summary_stats.items() if stats['success_rate'] > 0]
         
-        for i, t1 in enumerate(transpiler_names):
-            for t2 in transpiler_names[i+1:]:
-                s1 = summary_stats[t1]
-                s2 = summary_stats[t2]
-                
-                if s1['success_rate'] > 0 and s2['success_rate'] > 0:
-                    time_ratio = s1['avg_time_ms'] / s2['avg_time_ms']
-                    memory_ratio = s1['avg_memory_mb'] / s2['avg_memory_mb']
-                    throughput_ratio = s1['avg_throughput_lps'] / s2['avg_throughput_lps']
-                    
-                    print(f"\n{t1.upper()} vs {t2.upper()}:")
-                    print(f"  Time Ratio: {time_ratio:.2f}x ({t1} / {t2})")
-                    print(f"  Memory Ratio: {memory_ratio:.2f}x")
-                    print(f"  Throughput Ratio: {throughput_ratio:.2f}x")
-                    
-                    if time_ratio < 1:
-                        print(f"  🚀 {t1.upper()} is {1/time_ratio:.1f}x FASTER")
-                    else:
-                        print(f"  🐌 {t1.upper()} is {time_ratio:.1f}x slower")
-                    
-                    if throughput_ratio > 1:
-                        print(f"  📈 {t1.upper()} has {throughput_ratio:.1f}x higher throughput")
+        # ratios[i, j] holds transpiler i's time, memory and throughput over transpiler j's
+        averages = np.array([
+            [summary_stats[t]['avg_time_ms'], summary_stats[t]['avg_memory_mb'], summary_stats[t]['avg_throughput_lps']]
+            for t in transpiler_names
+        ], dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = averages[:, None, :] / averages[None, :, :]
+        
+        for i, j in zip(*np.triu_indices(len(transpiler_names), k=1)):
+            t1, t2 = transpiler_names[i], transpiler_names[j]
+            time_ratio, memory_ratio, throughput_ratio = ratios[i, j].tolist()
+            
+            print(f"\n{t1.upper()} vs {t2.upper()}:")
+            print(f"  Time Ratio: {time_ratio:.2f}x ({t1} / {t2})")
+            print(f"  Memory Ratio: {memory_ratio:.2f}x")
+            print(f"  Throughput Ratio: {throughput_ratio:.2f}x")
+            
+            if time_ratio < 1:
+                print(f"  🚀 {t1.upper()} is {1/time_ratio:.1f}x FASTER")
+            else:
+                print(f"  🐌 {t1.upper()} is {time_ratio:.1f}x slower")
+            
+            if throughput_ratio > 1:
+                print(f"  📈 {t1.upper()} has {throughput_ratio:.1f}x higher throughput")
     
     # Dataset performance breakdown
     print(f"\n{'='*80}")
     print("DATASET PERFORMANCE BREAKDOWN")
     print("="*80)
     
-    datasets = {}
-    for result in results:
-        dataset = result['dataset']
-        if dataset not in datasets:
-            datasets[dataset] = {}
-        transpiler = result['transpiler']
-        if transpiler not in datasets[dataset]:
-            datasets[dataset][transpiler] = []
-        datasets[dataset][transpiler].append(result)
-    
     for dataset_name, dataset_results in datasets.items():
         print(f"\nDataset: {dataset_name}")
         print("-" * 40)
@@ -132,20 +164,21 @@ def analyze_results():
         for transpiler, results_list in dataset_results.items():
             successful = [r for r in results_list if r['success']]
             if successful:
-                avg_time = statistics.mean([r['compilation_time_ms'] for r in successful])
-                avg_throughput = statistics.mean([r['lines_per_second'] for r in successful])
+                avg_time, avg_throughput = np.array([
+                    [r['compilation_time_ms'], r['lines_per_second']] for r in successful
+                ], dtype=np.float64).mean(axis=0).tolist()
                 print(f"  {transpiler:<10}: {avg_time:6.1f}ms  {avg_throughput:8.0f} LOC/s")
     
     # Save summary report
     reports_dir = Path('./reports')
     reports_dir.mkdir(exist_ok=True)
     
-    with open(reports_dir / 'benchmark_summary.json', 'w') as f:
-        json.dump({
+    with open(reports_dir / 'benchmark_summary.json', 'wb') as f:
+        f.write(json_dumps({
             'summary_stats': summary_stats,
             'datasets': {k: {t: len(r) for t, r in v.items()} for k, v in datasets.items()},
             'total_benchmarks': len(results)
-        }, f, indent=2)
+        }))
     
     print(f"\n📊 Summary report saved to: {reports_dir / 'benchmark_summary.json'}")
     print("✅ Analysis complete!")